@@ -1,24 +1,14 @@
 """Command-line interface for Markdown to DOCX converter."""
 
 import argparse
+import functools
+import importlib
 import logging
 import sys
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-from config import DEFAULT_TEMPLATE, PANDOC_PATH
-from converter.batch_service import BatchService
-from converter.converter_service import ConverterService
-from converter.errors import (
-    ConversionError,
-    FrontmatterError,
-    InvalidFileError,
-    MermaidRenderError,
-    PandocNotFoundError,
-    PDFEngineNotFoundError,
-    ProfileError,
-)
-from converter.profiles import list_profiles
+from config import PANDOC_PATH, get_default_template
 
 # Configure logging
 logging.basicConfig(
@@ -29,15 +19,111 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-# Load local profiles if available (not tracked by git)
-try:
-    import local_profiles  # noqa: F401
-    logger.debug("Local profiles loaded successfully")
-except ImportError:
-    pass  # No local profiles defined - this is fine
+# Heavy converter modules are imported lazily so that `--help` and
+# argument-error exits do not pay for Pandoc/frontmatter/profile loading.
+# Attribute access (e.g. cli.ConverterService) triggers the import via
+# __getattr__ below, which keeps test patch targets working.
+_LAZY_IMPORTS = {
+    "BatchService": ("converter.batch_service", "BatchService"),
+    "ConverterService": ("converter.converter_service", "ConverterService"),
+}
+
+
+def __getattr__(name: str):
+    """Lazily import heavy attributes on first access (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        module_name, attr = _LAZY_IMPORTS[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _lazy(name: str):
+    """Resolve a lazily imported attribute of this module."""
+    return getattr(sys.modules[__name__], name)
+
+
+def _load_local_profiles() -> None:
+    """Load local profiles if available (not tracked by git)."""
+    try:
+        import local_profiles  # noqa: F401
+        logger.debug("Local profiles loaded successfully")
+    except ImportError:
+        pass  # No local profiles defined - this is fine
+
 
 # Supported output formats
 SUPPORTED_FORMATS = ["docx", "pdf"]
+SUPPORTED_FORMATS_SET = frozenset(SUPPORTED_FORMATS)
+
+# User-facing messages for known converter errors, keyed by exception class
+# name. Dispatching on the name keeps converter.errors out of the import
+# graph until an error is actually raised.
+_SINGLE_ERROR_MESSAGES = {
+    "PandocNotFoundError": "{}",
+    "InvalidFileError": "Invalid input file - {}",
+    "FrontmatterError": "Frontmatter parsing failed - {}",
+    "ProfileError": "Profile error - {}",
+    "PDFEngineNotFoundError": "{}",
+    "MermaidRenderError": "{}",
+    "ConversionError": "Conversion failed - {}",
+}
+
+_BATCH_ERROR_MESSAGES = {
+    "PandocNotFoundError": "{}",
+    "ConversionError": "Batch conversion failed - {}",
+    "ProfileError": "Profile error - {}",
+    "PDFEngineNotFoundError": "{}",
+    "MermaidRenderError": "{}",
+}
+
+
+def _report_error(e: Exception, messages: dict) -> Optional[int]:
+    """
+    Print the user-facing message for a known converter error.
+
+    Args:
+        e: The caught exception.
+        messages: Error-name to message-template mapping.
+
+    Returns:
+        Exit code if the error was recognized, None otherwise.
+    """
+    name = type(e).__name__
+    template = messages.get(name)
+    if template is None:
+        return None
+    print(f"[ERROR] Error: {template.format(e)}", file=sys.stderr)
+    if name == "PandocNotFoundError":
+        print(
+            "\nPlease install Pandoc or specify the path using --pandoc-path",
+            file=sys.stderr,
+        )
+    return 1
+
+
+class _LazyChoices:
+    """Deferred argparse choices backed by the profile registry.
+
+    Loading the profile registry (including local profiles) is postponed
+    until argparse actually validates or displays the --profile flag.
+    """
+
+    def _load(self) -> List[str]:
+        _load_local_profiles()
+        from converter.profiles import list_profiles
+
+        return list_profiles()
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._load()
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __str__(self) -> str:
+        return ", ".join(self._load())
 
 
 def parse_formats(
@@ -55,11 +141,21 @@ def parse_formats(
         If error_message is not None, the formats list should be ignored.
     """
     if formats_str is not None and formats_str.strip() != "":
-        raw_formats = [f.strip().lower() for f in formats_str.split(",")]
-        # Filter out empty entries from extra commas/whitespace
-        raw_formats = [f for f in raw_formats if f]
+        # Single pass: validate and deduplicate (first occurrence wins)
+        seen = set()
+        formats: List[str] = []
+        invalid_formats: List[str] = []
+        for token in formats_str.split(","):
+            fmt = token.strip().lower()
+            if not fmt:
+                # Empty entry from extra commas/whitespace
+                continue
+            if fmt not in SUPPORTED_FORMATS_SET:
+                invalid_formats.append(fmt)
+            elif fmt not in seen:
+                seen.add(fmt)
+                formats.append(fmt)
 
-        invalid_formats = [f for f in raw_formats if f not in SUPPORTED_FORMATS]
         if invalid_formats:
             return (
                 None,
@@ -67,35 +163,37 @@ def parse_formats(
                 f"Valid formats: {', '.join(SUPPORTED_FORMATS)}",
             )
 
-        formats = [f for f in raw_formats if f in SUPPORTED_FORMATS]
         if not formats:
             return (
                 None,
                 f"--formats must contain at least one valid format "
                 f"({', '.join(SUPPORTED_FORMATS)})",
             )
-        # Deduplicate while preserving order (first occurrence wins)
-        seen = set()
-        deduplicated = []
-        for f in formats:
-            if f not in seen:
-                seen.add(f)
-                deduplicated.append(f)
-        return deduplicated, None
+        return formats, None
     return [default_format], None
 
 
-def create_parser() -> argparse.ArgumentParser:
+@functools.lru_cache(maxsize=4)
+def create_parser(
+    batch_mode: bool = True, pdf_options: bool = True
+) -> argparse.ArgumentParser:
     """
     Create and configure the argument parser.
 
+    By default the full parser is built. main() sniffs sys.argv and passes
+    batch_mode/pdf_options=False to skip argument subtrees that cannot be
+    needed for the current invocation, cutting parser construction cost.
+    Each variant is built once per process and reused - parsers carry no
+    state between parse_args calls.
+
+    Args:
+        batch_mode: If False, omit batch-only options (--recursive, --overwrite).
+        pdf_options: If False, omit PDF-related options (--formats, --pdf-engine).
+
     Returns:
         Configured ArgumentParser instance.
     """
-    parser = argparse.ArgumentParser(
-        description="Convert Markdown files to Word documents (.docx) or PDF",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+    epilog = """
 Examples:
   # Single file conversion (backward compatible)
   python cli.py input.md output.docx
@@ -103,17 +201,26 @@ Examples:
 
   # Single file with profile
   python cli.py input.md output.docx --profile report
-
+"""
+    if batch_mode:
+        epilog += """
   # Batch conversion
   python cli.py --batch input_folder output_folder
   python cli.py --batch input_folder output_folder --recursive --overwrite
   python cli.py --batch input_folder output_folder --profile angebot --template template.docx
-
+"""
+    if pdf_options:
+        epilog += """
   # PDF export
   python cli.py input.md output.pdf --format pdf
   python cli.py --batch input_folder output_folder --formats docx,pdf
   python cli.py input.md output.pdf --format pdf --pdf-engine xelatex
-        """,
+"""
+
+    parser = argparse.ArgumentParser(
+        description="Convert Markdown files to Word documents (.docx) or PDF",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=epilog,
     )
 
     # Mode selection
@@ -142,15 +249,18 @@ Examples:
     parser.add_argument(
         "--template",
         type=str,
-        default=DEFAULT_TEMPLATE,
+        default=None,
         help="Path to a DOCX template file (optional)",
     )
 
     parser.add_argument(
         "--profile",
         type=str,
-        choices=list_profiles(),
-        help=f"Preset profile to use (available: {', '.join(list_profiles())})",
+        choices=_LazyChoices(),
+        metavar="PROFILE",
+        # %(choices)s is expanded by argparse only when help is rendered,
+        # so the profile registry still loads lazily
+        help="Preset profile to use (available: %(choices)s)",
     )
 
     parser.add_argument(
@@ -161,20 +271,23 @@ Examples:
         help="Output format (default: docx)",
     )
 
-    parser.add_argument(
-        "--formats",
-        type=str,
-        help="Comma-separated list of output formats (e.g., 'docx,pdf'). "
-        "Useful for batch mode to generate multiple formats.",
-    )
+    if pdf_options:
+        parser.add_argument(
+            "--formats",
+            type=str,
+            help="Comma-separated list of output formats (e.g., 'docx,pdf'). "
+            "Useful for batch mode to generate multiple formats.",
+        )
 
-    parser.add_argument(
-        "--pdf-engine",
-        type=str,
-        choices=["xelatex", "lualatex", "pdflatex"],
-        help="PDF engine to use (xelatex, lualatex, pdflatex). "
-        "Auto-detected if not specified.",
-    )
+        parser.add_argument(
+            "--pdf-engine",
+            type=str,
+            choices=["xelatex", "lualatex", "pdflatex"],
+            help="PDF engine to use (xelatex, lualatex, pdflatex). "
+            "Auto-detected if not specified.",
+        )
+    else:
+        parser.set_defaults(formats=None, pdf_engine=None)
 
     parser.add_argument(
         "--pandoc-path",
@@ -191,18 +304,30 @@ Examples:
     )
 
     # Batch mode specific options
-    parser.add_argument(
-        "--recursive",
-        "-r",
-        action="store_true",
-        help="Process subdirectories recursively (batch mode only)",
-    )
+    if batch_mode:
+        parser.add_argument(
+            "--recursive",
+            "-r",
+            action="store_true",
+            help="Process subdirectories recursively (batch mode only)",
+        )
 
-    parser.add_argument(
-        "--overwrite",
-        action="store_true",
-        help="Overwrite existing DOCX files (batch mode only)",
-    )
+        parser.add_argument(
+            "--overwrite",
+            action="store_true",
+            help="Overwrite existing DOCX files (batch mode only)",
+        )
+
+        parser.add_argument(
+            "--jobs",
+            "-j",
+            type=int,
+            default=None,
+            help="Number of parallel conversions in batch mode "
+            "(default: number of CPUs)",
+        )
+    else:
+        parser.set_defaults(recursive=False, overwrite=False, jobs=None)
 
     return parser
 
@@ -227,29 +352,31 @@ def handle_single_conversion(args: argparse.Namespace) -> int:
         print(f"[ERROR] Error: {error}", file=sys.stderr)
         return 1
 
-    output_path = Path(args.output)
-    if output_path.exists() and output_path.is_dir():
+    base_output = Path(args.output)
+    if base_output.exists() and base_output.is_dir():
         print("[ERROR] Error: Output path must be a file, not a directory", file=sys.stderr)
         return 1
 
     try:
-        converter = ConverterService(pandoc_path=args.pandoc_path)
+        if args.profile:
+            _load_local_profiles()
+        converter = _lazy("ConverterService")(pandoc_path=args.pandoc_path)
 
         # Convert to each format
         output_files = []
+        multiple_formats = len(formats) > 1
         for output_format in formats:
             # Determine output path for this format
-            if len(formats) > 1:
-                # Multiple formats: adjust extension
-                output_path = Path(args.output)
-                output_path = output_path.with_suffix(f".{output_format}")
+            # (multiple formats: adjust extension, reusing the parsed base path)
+            if multiple_formats:
+                output_path = base_output.with_suffix(f".{output_format}")
             else:
                 output_path = args.output
 
             output_file = converter.convert(
                 input_path=args.input,
                 output_path=str(output_path),
-                template_path=args.template if args.template else None,
+                template_path=args.template or get_default_template(),
                 profile_name=args.profile,
                 output_format=output_format,
                 pdf_engine=args.pdf_engine,
@@ -264,43 +391,14 @@ def handle_single_conversion(args: argparse.Namespace) -> int:
                 print(f"  - {of}")
         return 0
 
-    except PandocNotFoundError as e:
-        print(f"[ERROR] Error: {e}", file=sys.stderr)
-        print(
-            "\nPlease install Pandoc or specify the path using --pandoc-path",
-            file=sys.stderr,
-        )
-        return 1
-
-    except InvalidFileError as e:
-        print(f"[ERROR] Error: Invalid input file - {e}", file=sys.stderr)
-        return 1
-
-    except FrontmatterError as e:
-        print(f"[ERROR] Error: Frontmatter parsing failed - {e}", file=sys.stderr)
-        return 1
-
-    except ProfileError as e:
-        print(f"[ERROR] Error: Profile error - {e}", file=sys.stderr)
-        return 1
-
-    except PDFEngineNotFoundError as e:
-        print(f"[ERROR] Error: {e}", file=sys.stderr)
-        return 1
-
-    except MermaidRenderError as e:
-        print(f"[ERROR] Error: {e}", file=sys.stderr)
-        return 1
-
-    except ConversionError as e:
-        print(f"[ERROR] Error: Conversion failed - {e}", file=sys.stderr)
-        return 1
-
     except KeyboardInterrupt:
         print("\n[ERROR] Conversion cancelled by user", file=sys.stderr)
         return 130
 
     except Exception as e:
+        exit_code = _report_error(e, _SINGLE_ERROR_MESSAGES)
+        if exit_code is not None:
+            return exit_code
         logger.exception("Unexpected error occurred")
         print(f"[ERROR] Unexpected error: {e}", file=sys.stderr)
         return 1
@@ -351,18 +449,24 @@ def handle_batch_conversion(args: argparse.Namespace) -> int:
         return 1
 
     try:
-        converter = ConverterService(pandoc_path=args.pandoc_path)
-        batch_service = BatchService(converter)
+        if args.profile:
+            _load_local_profiles()
+        converter = _lazy("ConverterService")(pandoc_path=args.pandoc_path)
+        batch_service = _lazy("BatchService")(converter)
+
+        # Fail fast on a broken pandoc/LaTeX setup before touching any file
+        converter.warm_up(formats=formats, pdf_engine=args.pdf_engine)
 
         result = batch_service.convert_batch(
             input_dir=input_dir,
             output_dir=output_dir,
             recursive=args.recursive,
             overwrite=args.overwrite,
-            template_path=args.template if args.template else None,
+            template_path=args.template or get_default_template(),
             profile_name=args.profile,
             formats=formats,
             pdf_engine=args.pdf_engine,
+            jobs=args.jobs,
         )
 
         print(f"\n{result}")
@@ -370,38 +474,20 @@ def handle_batch_conversion(args: argparse.Namespace) -> int:
             print("\nErrors:")
             for file_path, error_msg in result.errors:
                 print(f"  - {file_path}: {error_msg}")
+            hidden = result.failed - len(result.errors)
+            if hidden > 0:
+                print(f"  ... and {hidden} earlier error(s) not shown")
 
         return 0 if result.failed == 0 else 1
 
-    except PandocNotFoundError as e:
-        print(f"[ERROR] Error: {e}", file=sys.stderr)
-        print(
-            "\nPlease install Pandoc or specify the path using --pandoc-path",
-            file=sys.stderr,
-        )
-        return 1
-
-    except ConversionError as e:
-        print(f"[ERROR] Error: Batch conversion failed - {e}", file=sys.stderr)
-        return 1
-
-    except ProfileError as e:
-        print(f"[ERROR] Error: Profile error - {e}", file=sys.stderr)
-        return 1
-
-    except PDFEngineNotFoundError as e:
-        print(f"[ERROR] Error: {e}", file=sys.stderr)
-        return 1
-
-    except MermaidRenderError as e:
-        print(f"[ERROR] Error: {e}", file=sys.stderr)
-        return 1
-
     except KeyboardInterrupt:
         print("\n[ERROR] Batch conversion cancelled by user", file=sys.stderr)
         return 130
 
     except Exception as e:
+        exit_code = _report_error(e, _BATCH_ERROR_MESSAGES)
+        if exit_code is not None:
+            return exit_code
         logger.exception("Unexpected error occurred")
         print(f"[ERROR] Unexpected error: {e}", file=sys.stderr)
         return 1
@@ -414,8 +500,28 @@ def main() -> int:
     Returns:
         Exit code (0 for success, non-zero for error).
     """
-    parser = create_parser()
-    args = parser.parse_args()
+    # Sniff sys.argv to build only the argparse subtree this invocation
+    # can actually use. --help always gets the full parser.
+    argv = sys.argv[1:]
+    batch_mode = "--batch" in argv
+    pdf_flags = ("--format", "--formats", "--pdf-engine")
+    pdf_options = any(
+        token in pdf_flags or token.startswith(tuple(f + "=" for f in pdf_flags))
+        for token in argv
+    )
+    help_requested = "-h" in argv or "--help" in argv
+
+    if help_requested:
+        parser = create_parser()
+        args = parser.parse_args()
+    else:
+        parser = create_parser(batch_mode=batch_mode, pdf_options=pdf_options)
+        args, extras = parser.parse_known_args()
+        if extras:
+            # Sniff missed something (rare) - fall back to the full parser,
+            # which either accepts the arguments or reports the real error.
+            parser = create_parser()
+            args = parser.parse_args()
 
     # Set logging level
     if args.verbose:
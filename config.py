@@ -1,5 +1,6 @@
 """Configuration settings for the converter."""
 
+import functools
 import os
 from pathlib import Path
 from typing import Optional
@@ -7,13 +8,24 @@ from typing import Optional
 # Default Pandoc path (None means search in PATH)
 PANDOC_PATH: Optional[str] = os.getenv("PANDOC_PATH", None)
 
-# Default template path (None means no template)
-DEFAULT_TEMPLATE: Optional[str] = os.getenv("MD_CONVERTER_TEMPLATE", None)
 
-# If DEFAULT_TEMPLATE is set and relative, resolve it relative to project root
-if DEFAULT_TEMPLATE:
-    template_path = Path(DEFAULT_TEMPLATE)
-    if not template_path.is_absolute():
-        # Resolve relative to project root
-        project_root = Path(__file__).parent
-        DEFAULT_TEMPLATE = str(project_root / template_path)
+@functools.lru_cache(maxsize=1)
+def get_default_template() -> Optional[str]:
+    """
+    Resolve the default template path from the environment.
+
+    If MD_CONVERTER_TEMPLATE is set and relative, it is resolved relative
+    to the project root. The result is cached per process; resolution is
+    deferred so CLI startup doesn't pay for it when no template is used.
+
+    Returns:
+        Resolved template path or None if no default template is set.
+    """
+    default_template = os.getenv("MD_CONVERTER_TEMPLATE", None)
+    if default_template:
+        template_path = Path(default_template)
+        if not template_path.is_absolute():
+            # Resolve relative to project root
+            project_root = Path(__file__).parent
+            default_template = str(project_root / template_path)
+    return default_template
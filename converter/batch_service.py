@@ -1,8 +1,12 @@
 """Batch conversion service for processing multiple Markdown files."""
 
 import logging
+import os
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Deque, Dict, List, Optional, TextIO, Tuple, Set
 
 from converter.converter_service import ConverterService
 from converter.errors import ConversionError
@@ -11,6 +15,137 @@ from converter.paths import get_output_filename
 
 logger = logging.getLogger(__name__)
 
+# How many recent errors BatchResult keeps in memory; older errors are
+# only counted (and optionally written to the error log file)
+ERROR_RETENTION = 1000
+
+# Fast title extraction: only the frontmatter title is needed for output
+# naming, so scan at most this many bytes instead of parsing the file.
+# The pattern is byte-level so the prelude is never decoded; only the
+# matched title value is.
+_FRONTMATTER_SCAN_BYTES = 4096
+_TITLE_PATTERN = re.compile(rb"^title:\s*(.+)$", re.MULTILINE)
+
+
+def _find_md_files(root: Path, recursive: bool) -> List[Path]:
+    """
+    Find Markdown files using os.scandir instead of Path.glob.
+
+    scandir exposes the cached dirent type, so filtering by suffix and file
+    type avoids the extra stat calls and Path allocations pathlib's glob
+    performs per directory entry. Symlinked Markdown files are followed
+    (matching the glob this replaced); only symlinked directories are
+    skipped, as glob's ``**`` does not descend into them either.
+
+    Args:
+        root: Directory to search.
+        recursive: If True, descend into subdirectories.
+
+    Returns:
+        List of Markdown file paths.
+    """
+    md_files: List[Path] = []
+    stack = [str(root)]
+
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # is_file() still uses the cached dirent type for
+                    # regular files; only actual symlinks pay a stat
+                    if entry.name.endswith(".md") and entry.is_file():
+                        md_files.append(Path(entry.path))
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError as e:
+            logger.warning("Cannot scan directory %s: %s", directory, e)
+
+    return md_files
+
+
+def _has_frontmatter_header(md_file: Path) -> bool:
+    """Cheaply check whether a file starts with a frontmatter delimiter."""
+    try:
+        with open(md_file, "rb") as f:
+            head = f.read(8)
+    except OSError:
+        return False
+    if head.startswith(b"\xef\xbb\xbf"):
+        head = head[3:]
+    return head.startswith(b"---")
+
+
+def _probable_output_name(md_file: Path, output_format: str) -> str:
+    """Output filename for a file without a frontmatter title."""
+    return get_output_filename(md_file, None, output_format=output_format)
+
+
+def _list_existing_names(directory: Path) -> Set[str]:
+    """List existing filenames in a directory with a single scandir call."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+def _extract_title_fast(md_file: Path) -> Optional[str]:
+    """
+    Extract the frontmatter title without reading the whole file.
+
+    Reads at most the first ~4KB as raw bytes, looks for a ``title:`` line
+    inside the frontmatter block, and falls back to the full
+    parse_frontmatter only when a frontmatter header exists but the fast
+    scan finds no decodable title.
+
+    Args:
+        md_file: Markdown file to scan.
+
+    Returns:
+        Title string or None if the file has no frontmatter title.
+    """
+    try:
+        with open(md_file, "rb") as f:
+            head = f.read(_FRONTMATTER_SCAN_BYTES)
+    except OSError:
+        return None
+
+    if head.startswith(b"\xef\xbb\xbf"):
+        head = head[3:]
+    if not head.startswith(b"---"):
+        # No frontmatter header -> no title
+        return None
+
+    # Limit the scan to the frontmatter block. If no closing delimiter is
+    # found in the head, the block may be unterminated (e.g. a thematic
+    # break, where a "title:" later in the body must not win) or larger
+    # than the scan window - only the full parser can tell the difference.
+    end = head.find(b"\n---", 3)
+    if end == -1:
+        frontmatter, _ = parse_frontmatter(md_file)
+        return frontmatter.title if frontmatter else None
+    block = head[3:end]
+
+    match = _TITLE_PATTERN.search(block)
+    if match:
+        try:
+            value = match.group(1).decode("utf-8").strip()
+        except UnicodeDecodeError:
+            # Non-UTF8 title - let parse_frontmatter handle the encoding fallback
+            frontmatter, _ = parse_frontmatter(md_file)
+            return frontmatter.title if frontmatter else None
+        # Remove quotes if present (mirrors the frontmatter parser)
+        if (value.startswith('"') and value.endswith('"')) or (
+            value.startswith("'") and value.endswith("'")
+        ):
+            value = value[1:-1]
+        return value or None
+
+    # Header present but no title in the scanned head - use the full parser
+    frontmatter, _ = parse_frontmatter(md_file)
+    return frontmatter.title if frontmatter else None
+
 
 class BatchResult:
     """Result of a batch conversion operation."""
@@ -20,7 +155,8 @@ class BatchResult:
         self.successful: int = 0
         self.skipped: int = 0
         self.failed: int = 0
-        self.errors: List[Tuple[Path, str]] = []
+        # Bounded: keeps the most recent errors; failed holds the full count
+        self.errors: Deque[Tuple[str, str]] = deque(maxlen=ERROR_RETENTION)
 
     def __str__(self) -> str:
         """String representation of batch result."""
@@ -33,14 +169,44 @@ class BatchResult:
 class BatchService:
     """Service for batch converting multiple Markdown files."""
 
-    def __init__(self, converter_service: ConverterService):
+    def __init__(
+        self,
+        converter_service: ConverterService,
+        error_log_path: Optional[Path] = None,
+    ):
         """
         Initialize batch service.
 
         Args:
             converter_service: ConverterService instance to use for conversions.
+            error_log_path: Optional file that receives one line per failed
+                conversion (useful for very large batches, where only the
+                most recent errors are kept in memory).
         """
         self.converter = converter_service
+        self.error_log_path = error_log_path
+        self._error_log: Optional[TextIO] = None
+
+    def _record_failure(
+        self,
+        result: "BatchResult",
+        md_file: Path,
+        output_format: str,
+        error_msg: str,
+    ) -> None:
+        """Count a failed conversion and retain/log its error message."""
+        logger.error(
+            "Failed to convert %s to %s: %s",
+            md_file,
+            output_format,
+            error_msg,
+        )
+        result.failed += 1
+        result.errors.append((str(md_file), f"{output_format}: {error_msg}"))
+        if self.error_log_path is not None:
+            if self._error_log is None:
+                self._error_log = open(self.error_log_path, "a", encoding="utf-8")
+            self._error_log.write(f"{md_file}\t{output_format}\t{error_msg}\n")
 
     def convert_batch(
         self,
@@ -52,6 +218,7 @@ class BatchService:
         profile_name: Optional[str] = None,
         formats: Optional[List[str]] = None,
         pdf_engine: Optional[str] = None,
+        jobs: Optional[int] = None,
     ) -> BatchResult:
         """
         Convert all Markdown files in a directory.
@@ -65,6 +232,7 @@ class BatchService:
             profile_name: Optional profile name.
             formats: List of output formats (e.g., ["docx", "pdf"]). Default: ["docx"].
             pdf_engine: Optional PDF engine (xelatex, lualatex, pdflatex).
+            jobs: Number of parallel conversion workers. Default: CPU count.
 
         Returns:
             BatchResult with conversion statistics.
@@ -89,11 +257,10 @@ class BatchService:
             ) from e
 
         # Find all Markdown files
-        pattern = "**/*.md" if recursive else "*.md"
-        md_files = list(input_dir.glob(pattern))
+        md_files = _find_md_files(input_dir, recursive)
 
         if not md_files:
-            logger.warning(f"No Markdown files found in {input_dir}")
+            logger.warning("No Markdown files found in %s", input_dir)
             return result
 
         # Determine formats to use
@@ -102,27 +269,88 @@ class BatchService:
         else:
             formats = [f.lower() for f in formats]
 
-        logger.info(f"Found {len(md_files)} Markdown file(s) to process")
-        logger.info(f"Output formats: {', '.join(formats)}")
+        logger.info("Found %s Markdown file(s) to process", len(md_files))
+        logger.info("Output formats: %s", ', '.join(formats))
 
-        # Track used output filenames to handle collisions within the batch
+        # Track used output filenames to handle collisions within the batch.
+        # next_counter remembers the next free suffix per base filename so
+        # collision resolution is O(1) amortized instead of rescanning from 2.
         used_output_files: Set[Path] = set()
+        next_counter: Dict[Path, int] = {}
+
+        # Cache extracted titles per file (avoids re-reading across formats)
+        title_cache: Dict[Path, Optional[str]] = {}
+
+        # Plan all conversions first so skip checks and collision resolution
+        # stay deterministic, then execute the independent Pandoc runs
+        # (subprocess-bound) in parallel.
+        tasks: List[Tuple[Path, str, Path]] = []
+
+        # Precompute output subdirectories and create each unique one exactly
+        # once instead of issuing a mkdir syscall per (file, format) pair
+        if recursive:
+            subdirs: Dict[Path, Path] = {
+                md_file: output_dir / md_file.relative_to(input_dir).parent
+                for md_file in md_files
+            }
+        else:
+            subdirs = {md_file: output_dir for md_file in md_files}
+
+        for subdir in set(subdirs.values()):
+            try:
+                subdir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                raise ConversionError(
+                    f"Cannot create output subdirectory '{subdir}': {e}"
+                ) from e
+
+        # Pre-flight skip scan: with overwrite=False, files without
+        # frontmatter map deterministically to <stem>.<format>, so existing
+        # outputs can be skipped with one directory listing per subdirectory
+        # and without reading any file content
+        # With overwrite=False, one scandir per output subdirectory replaces
+        # a stat syscall per (file, format) pair in all skip/collision checks
+        existing_names: Dict[Path, Set[str]] = {}
+        if not overwrite:
+            existing_names = {
+                subdir: _list_existing_names(subdir)
+                for subdir in set(subdirs.values())
+            }
+
+        preskipped: Set[Tuple[Path, str]] = set()
+        if not overwrite:
+            for md_file in md_files:
+                if _has_frontmatter_header(md_file):
+                    continue  # Output name may depend on the title
+                names = existing_names[subdirs[md_file]]
+                for output_format in formats:
+                    probable_name = _probable_output_name(md_file, output_format)
+                    if probable_name in names:
+                        logger.info(
+                            "Skipping %s -> %s (output exists: %s)",
+                            md_file.name,
+                            output_format,
+                            probable_name,
+                        )
+                        result.skipped += 1
+                        preskipped.add((md_file, output_format))
 
         for md_file in md_files:
-            # Determine relative path for output structure
-            if recursive:
-                relative_path = md_file.relative_to(input_dir)
-                output_subdir = output_dir / relative_path.parent
-            else:
-                output_subdir = output_dir
-
-            # Determine base output filename (without extension)
-            frontmatter, _ = parse_frontmatter(md_file)
-            title = frontmatter.title if frontmatter else None
+            output_subdir = subdirs[md_file]
+            names = existing_names.get(output_subdir, set())
 
-            # Process each format
+            # Plan each format
             for output_format in formats:
+                if (md_file, output_format) in preskipped:
+                    continue
+
                 try:
+                    # Determine base output filename lazily (cached per file)
+                    if md_file in title_cache:
+                        title = title_cache[md_file]
+                    else:
+                        title = title_cache[md_file] = _extract_title_fast(md_file)
+
                     # Generate base output filename for this format
                     base_output_filename = get_output_filename(
                         md_file, title, output_format=output_format
@@ -131,13 +359,15 @@ class BatchService:
 
                     # Skip if output exists from previous run and overwrite is False
                     if (
-                        base_output_file.exists()
-                        and not overwrite
+                        not overwrite
+                        and base_output_filename in names
                         and base_output_file not in used_output_files
                     ):
                         logger.info(
-                            f"Skipping {md_file.name} -> {output_format} "
-                            f"(output exists: {base_output_file.name})"
+                            "Skipping %s -> %s (output exists: %s)",
+                            md_file.name,
+                            output_format,
+                            base_output_file.name,
                         )
                         result.skipped += 1
                         continue
@@ -151,59 +381,119 @@ class BatchService:
                         if "_" in base_stem and base_stem.split("_")[-1].isdigit():
                             base_stem = "_".join(base_stem.split("_")[:-1])
 
-                        counter = 2
+                        counter = next_counter.get(base_output_file, 2)
                         while True:
                             candidate = output_subdir / f"{base_stem}_{counter}{base_output_file.suffix}"
+                            counter += 1
                             if candidate not in used_output_files and (
-                                overwrite or not candidate.exists()
+                                overwrite or candidate.name not in names
                             ):
                                 output_file = candidate
                                 break
-                            counter += 1
+                        next_counter[base_output_file] = counter
                         logger.debug(
-                            f"Output filename collision resolved: "
-                            f"{base_output_filename} -> {output_file.name}"
+                            "Output filename collision resolved: %s -> %s",
+                            base_output_filename,
+                            output_file.name,
                         )
 
                     # Check if output exists after collision resolution
-                    if output_file.exists() and not overwrite and output_file not in used_output_files:
+                    if not overwrite and output_file.name in names and output_file not in used_output_files:
                         logger.info(
-                            f"Skipping {md_file.name} -> {output_format} "
-                            f"(output exists: {output_file.name})"
+                            "Skipping %s -> %s (output exists: %s)",
+                            md_file.name,
+                            output_format,
+                            output_file.name,
                         )
                         result.skipped += 1
                         continue
 
-                    # Ensure output subdirectory exists
-                    try:
-                        output_subdir.mkdir(parents=True, exist_ok=True)
-                    except OSError as e:
-                        raise ConversionError(
-                            f"Cannot create output subdirectory '{output_subdir}': {e}"
-                        ) from e
-
-                    # Perform conversion
-                    logger.info(
-                        f"Converting {md_file.name} -> {output_file.name} ({output_format})"
-                    )
-                    self.converter.convert(
-                        input_path=str(md_file),
-                        output_path=str(output_file),
-                        template_path=template_path,
-                        profile_name=profile_name,
-                        output_format=output_format,
-                        pdf_engine=pdf_engine,
-                    )
+                    # Reserve the name now so later files resolve collisions
+                    # against the planned outputs
                     used_output_files.add(output_file)
-                    result.successful += 1
+                    tasks.append((md_file, output_format, output_file))
 
                 except Exception as e:
-                    error_msg = str(e)
-                    logger.error(
-                        f"Failed to convert {md_file} to {output_format}: {error_msg}"
+                    self._record_failure(result, md_file, output_format, str(e))
+
+        # Execute planned conversions
+        max_workers = min(len(tasks), jobs or os.cpu_count() or 4) if tasks else 0
+
+        if max_workers <= 1:
+            for md_file, output_format, output_file in tasks:
+                try:
+                    self._convert_one(
+                        md_file,
+                        output_format,
+                        output_file,
+                        template_path,
+                        profile_name,
+                        pdf_engine,
                     )
-                    result.failed += 1
-                    result.errors.append((md_file, f"{output_format}: {error_msg}"))
+                    result.successful += 1
+                except Exception as e:
+                    self._record_failure(result, md_file, output_format, str(e))
+        else:
+            logger.info("Converting with %s parallel worker(s)", max_workers)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_task = {
+                    executor.submit(
+                        self._convert_one,
+                        md_file,
+                        output_format,
+                        output_file,
+                        template_path,
+                        profile_name,
+                        pdf_engine,
+                    ): (md_file, output_format)
+                    for md_file, output_format, output_file in tasks
+                }
+                for future in as_completed(future_to_task):
+                    md_file, output_format = future_to_task[future]
+                    try:
+                        future.result()
+                        result.successful += 1
+                    except Exception as e:
+                        self._record_failure(result, md_file, output_format, str(e))
+
+        if self._error_log is not None:
+            self._error_log.close()
+            self._error_log = None
 
         logger.info(str(result))
         return result
+
+    def _convert_one(
+        self,
+        md_file: Path,
+        output_format: str,
+        output_file: Path,
+        template_path: Optional[str],
+        profile_name: Optional[str],
+        pdf_engine: Optional[str],
+    ) -> None:
+        """
+        Convert a single planned (file, format) pair.
+
+        Args:
+            md_file: Input Markdown file.
+            output_format: Output format ("docx" or "pdf").
+            output_file: Resolved output file path.
+            template_path: Optional template path (only for docx).
+            profile_name: Optional profile name.
+            pdf_engine: Optional PDF engine.
+        """
+        logger.info(
+            "Converting %s -> %s (%s)",
+            md_file.name,
+            output_file.name,
+            output_format,
+        )
+        self.converter.convert(
+            input_path=str(md_file),
+            output_path=str(output_file),
+            template_path=template_path,
+            profile_name=profile_name,
+            output_format=output_format,
+            pdf_engine=pdf_engine,
+        )
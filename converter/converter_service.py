@@ -8,10 +8,6 @@ from typing import Dict, List, Optional
 from converter.errors import ConversionError, InvalidFileError
 from converter.frontmatter import parse_frontmatter
 from converter.landscape_processor import apply_landscape_sections
-from converter.mermaid_processor import (
-    has_mermaid_diagrams,
-    process_mermaid_in_markdown,
-)
 from converter.pandoc_wrapper import PandocWrapper
 from converter.paths import get_output_filename, resolve_template_path
 from converter.profiles import Profile, get_profile
@@ -31,6 +27,75 @@ class ConverterService:
         """
         self.pandoc_wrapper = PandocWrapper(pandoc_path)
 
+    def warm_up(
+        self,
+        formats: Optional[List[str]] = None,
+        pdf_engine: Optional[str] = None,
+    ) -> None:
+        """
+        Pre-resolve pandoc and PDF-engine state before a batch of conversions.
+
+        Fails fast with the usual exceptions instead of erroring once per
+        file; results are cached on the wrapper for subsequent convert calls.
+
+        Args:
+            formats: Output formats that will be requested (e.g., ["docx", "pdf"]).
+            pdf_engine: Optional preferred PDF engine.
+
+        Raises:
+            PandocNotFoundError: If pandoc is not runnable.
+            PDFEngineNotFoundError: If PDF output is requested but no engine exists.
+        """
+        need_pdf = bool(formats) and "pdf" in formats
+        self.pandoc_wrapper.warm_up(need_pdf=need_pdf, pdf_engine=pdf_engine)
+
+    def convert_many(
+        self,
+        input_paths: List[str],
+        template_path: Optional[str] = None,
+        profile_name: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        additional_args: Optional[List[str]] = None,
+        output_format: str = "docx",
+        pdf_engine: Optional[str] = None,
+    ) -> List[Path]:
+        """
+        Convert several Markdown files with shared settings.
+
+        Pandoc itself must run once per output file, but the version and
+        PDF-engine probes run once for the whole batch instead of per
+        file, and all conversions share this wrapper's caches.
+
+        Args:
+            input_paths: Paths to the input Markdown files.
+            template_path: Optional template path applied to every file.
+            profile_name: Optional profile name applied to every file.
+            metadata: Optional metadata dictionary (overrides frontmatter).
+            additional_args: Optional additional Pandoc arguments.
+            output_format: Output format ("docx" or "pdf").
+            pdf_engine: Optional PDF engine. Auto-detected if None.
+
+        Returns:
+            List of output file paths, in input order.
+
+        Raises:
+            InvalidFileError: If an input file is invalid.
+            ConversionError: If a conversion fails.
+        """
+        self.warm_up(formats=[output_format], pdf_engine=pdf_engine)
+        return [
+            self.convert(
+                input_path,
+                template_path=template_path,
+                profile_name=profile_name,
+                metadata=metadata,
+                additional_args=additional_args,
+                output_format=output_format,
+                pdf_engine=pdf_engine,
+            )
+            for input_path in input_paths
+        ]
+
     def convert(
         self,
         input_path: str,
@@ -73,18 +138,39 @@ class ConverterService:
 
         if not input_file.suffix.lower() == ".md":
             logger.warning(
-                f"Input file does not have .md extension: {input_file.suffix}"
+                "Input file does not have .md extension: %s",
+                input_file.suffix,
             )
 
         # Parse frontmatter
         frontmatter, content = parse_frontmatter(input_file)
         frontmatter_metadata = frontmatter.to_pandoc_variables() if frontmatter else {}
 
+        # Get profile if specified (resolved before Mermaid processing so
+        # profiles can opt out of diagram rendering)
+        profile: Optional[Profile] = None
+        if profile_name:
+            try:
+                profile = get_profile(profile_name)
+                logger.info("Using profile: %s", profile_name)
+            except Exception as e:
+                logger.warning(
+                    "Could not load profile '%s': %s",
+                    profile_name,
+                    e,
+                )
+
         # Process Mermaid diagrams if present
         processed_input_file = input_file
         temp_markdown_file: Optional[Path] = None
 
-        if has_mermaid_diagrams(content):
+        render_mermaid = profile is None or profile.render_mermaid
+        if render_mermaid and "```mermaid" in content.lower():
+            # Imported lazily so pure-Markdown conversions never load the
+            # Mermaid/subprocess machinery; process_mermaid_in_markdown
+            # re-checks for actual diagram blocks itself
+            from converter.mermaid_processor import process_mermaid_in_markdown
+
             logger.info("Processing Mermaid diagrams...")
             processed_content, mermaid_images = process_mermaid_in_markdown(
                 content,
@@ -103,7 +189,10 @@ class ConverterService:
                 with open(temp_fd, 'w', encoding='utf-8') as f:
                     f.write(processed_content)
                 processed_input_file = temp_markdown_file
-                logger.info(f"Rendered {len(mermaid_images)} Mermaid diagram(s)")
+                logger.info(
+                    "Rendered %s Mermaid diagram(s)",
+                    len(mermaid_images),
+                )
 
         # Merge metadata (explicit metadata overrides frontmatter)
         # Log overrides for transparency
@@ -111,21 +200,14 @@ class ConverterService:
             for key in metadata.keys():
                 if key in frontmatter_metadata:
                     logger.debug(
-                        f"Metadata key '{key}' overridden by explicit metadata "
-                        f"(frontmatter: '{frontmatter_metadata[key]}' -> explicit: '{metadata[key]}')"
+                        "Metadata key '%s' overridden by explicit metadata (frontmatter: '%s' -> explicit: '%s')",
+                        key,
+                        frontmatter_metadata[key],
+                        metadata[key],
                     )
 
         final_metadata = {**frontmatter_metadata, **(metadata or {})}
 
-        # Get profile if specified
-        profile: Optional[Profile] = None
-        if profile_name:
-            try:
-                profile = get_profile(profile_name)
-                logger.info(f"Using profile: {profile_name}")
-            except Exception as e:
-                logger.warning(f"Could not load profile '{profile_name}': {e}")
-
         # Determine template path (CLI arg > profile > None)
         resolved_template: Optional[Path] = None
         if template_path:
@@ -134,7 +216,7 @@ class ConverterService:
             resolved_template = profile.get_template_path(input_file.parent)
 
         if resolved_template and not resolved_template.exists():
-            logger.warning(f"Template not found: {resolved_template}")
+            logger.warning("Template not found: %s", resolved_template)
             resolved_template = None
 
         # Determine output format (profile default > explicit > docx)
@@ -176,8 +258,10 @@ class ConverterService:
             pandoc_args.extend(additional_args)
 
         logger.info(
-            f"Converting {input_file.name} to {output_file.name} "
-            f"(format: {output_format})"
+            "Converting %s to %s (format: %s)",
+            input_file.name,
+            output_file.name,
+            output_format,
         )
 
         try:
@@ -206,12 +290,14 @@ class ConverterService:
                         logger.info("Landscape sections applied successfully")
                 except Exception as e:
                     logger.warning(
-                        f"Landscape post-processing failed: {e}. "
-                        f"DOCX was saved without landscape sections."
+                        "Landscape post-processing failed: %s. DOCX was saved without landscape sections.",
+                        e,
                     )
 
             logger.info(
-                f"Successfully converted {input_file.name} to {output_file.name}"
+                "Successfully converted %s to %s",
+                input_file.name,
+                output_file.name,
             )
             return output_file
         except ConversionError:
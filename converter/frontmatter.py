@@ -2,6 +2,8 @@
 
 import logging
 import re
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Tuple
@@ -10,6 +12,23 @@ from converter.errors import FrontmatterError
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import - the YAML parser runs per line per file
+_YAML_LINE_RE = re.compile(r"^([a-zA-Z_][a-zA-Z0-9_]*)\s*:\s*(.*)$")
+_QUOTE_RE = re.compile(r"^(['\"])(.*)\1$")
+
+# Fast path for the overwhelmingly common ISO date; strptime re-parses
+# its format string on every call
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Accepted date formats, in order of likelihood
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%d.%m.%Y",
+    "%d/%m/%Y",
+    "%Y/%m/%d",
+    "%d-%m-%Y",
+)
+
 # Expected frontmatter fields
 FRONTMATTER_FIELDS = {
     "title": str,
@@ -25,6 +44,9 @@ FRONTMATTER_FIELDS = {
 class FrontmatterData:
     """Container for parsed frontmatter data."""
 
+    # Slots avoid a per-instance __dict__ - one instance per converted file
+    __slots__ = tuple(FRONTMATTER_FIELDS)
+
     def __init__(self, data: Dict[str, str]):
         """
         Initialize frontmatter data.
@@ -32,13 +54,8 @@ class FrontmatterData:
         Args:
             data: Dictionary of frontmatter key-value pairs.
         """
-        self.title: Optional[str] = data.get("title")
-        self.subtitle: Optional[str] = data.get("subtitle")
-        self.author: Optional[str] = data.get("author")
-        self.version: Optional[str] = data.get("version")
-        self.date: Optional[str] = data.get("date")
-        self.customer: Optional[str] = data.get("customer")
-        self.project: Optional[str] = data.get("project")
+        for key in FRONTMATTER_FIELDS:
+            setattr(self, key, data.get(key))
 
     def to_dict(self) -> Dict[str, str]:
         """
@@ -48,8 +65,8 @@ class FrontmatterData:
             Dictionary of frontmatter fields (None values excluded).
         """
         result = {}
-        for key in FRONTMATTER_FIELDS.keys():
-            value = getattr(self, key, None)
+        for key in FRONTMATTER_FIELDS:
+            value = getattr(self, key)
             if value is not None:
                 result[key] = value
         return result
@@ -59,30 +76,35 @@ class FrontmatterData:
         Convert frontmatter data to Pandoc variables.
 
         Returns:
-            Dictionary of Pandoc variable assignments.
+            Dictionary of Pandoc variable assignments (empty values excluded).
         """
         variables = {}
-        if self.title:
-            variables["title"] = self.title
-        if self.subtitle:
-            variables["subtitle"] = self.subtitle
-        if self.author:
-            variables["author"] = self.author
-        if self.version:
-            variables["version"] = self.version
-        if self.date:
-            variables["date"] = self.date
-        if self.customer:
-            variables["customer"] = self.customer
-        if self.project:
-            variables["project"] = self.project
+        for key in FRONTMATTER_FIELDS:
+            value = getattr(self, key)
+            if value:
+                variables[key] = value
         return variables
 
 
+# Parsed results keyed by (path, mtime_ns, size), LRU-evicted. Converting
+# the same unchanged file again (e.g. to docx and pdf) reuses the parse.
+# Each entry holds the full decoded content, so the cache is bounded by
+# total content size rather than entry count - a batch over large
+# documents must not pin unbounded memory. Guarded by a lock because
+# batch workers run in threads.
+_FM_CACHE: "OrderedDict[Tuple[str, int, int], Tuple[Optional[FrontmatterData], str]]" = OrderedDict()
+_FM_CACHE_MAX_BYTES = 8 * 1024 * 1024
+_fm_cache_bytes = 0
+_FM_CACHE_LOCK = threading.Lock()
+
+
 def parse_frontmatter(file_path: Path) -> Tuple[Optional[FrontmatterData], str]:
     """
     Parse YAML frontmatter from a Markdown file.
 
+    Results are cached per (path, mtime, size), so re-parsing an
+    unchanged file is a dictionary lookup.
+
     Args:
         file_path: Path to the Markdown file.
 
@@ -92,19 +114,90 @@ def parse_frontmatter(file_path: Path) -> Tuple[Optional[FrontmatterData], str]:
     Raises:
         FrontmatterError: If frontmatter is malformed.
     """
+    cache_key: Optional[Tuple[str, int, int]] = None
+    try:
+        st = file_path.stat()
+        cache_key = (str(file_path), st.st_mtime_ns, st.st_size)
+    except OSError:
+        # Unreadable path - fall through so the read below raises the
+        # usual FrontmatterError
+        pass
+
+    if cache_key is not None:
+        with _FM_CACHE_LOCK:
+            cached = _FM_CACHE.get(cache_key)
+            if cached is not None:
+                _FM_CACHE.move_to_end(cache_key)
+                return cached
+
+    result = _parse_frontmatter_uncached(file_path)
+
+    # Entries larger than the budget are not worth evicting everything for
+    entry_bytes = len(result[1])
+    if cache_key is not None and entry_bytes <= _FM_CACHE_MAX_BYTES:
+        global _fm_cache_bytes
+        with _FM_CACHE_LOCK:
+            # Two threads may race to store the same key - account for
+            # the entry being replaced, not just added
+            previous = _FM_CACHE.get(cache_key)
+            if previous is not None:
+                _fm_cache_bytes -= len(previous[1])
+            _FM_CACHE[cache_key] = result
+            _FM_CACHE.move_to_end(cache_key)
+            _fm_cache_bytes += entry_bytes
+            while _fm_cache_bytes > _FM_CACHE_MAX_BYTES and _FM_CACHE:
+                _, (_, evicted_content) = _FM_CACHE.popitem(last=False)
+                _fm_cache_bytes -= len(evicted_content)
+
+    return result
+
+
+def _parse_frontmatter_uncached(
+    file_path: Path,
+) -> Tuple[Optional[FrontmatterData], str]:
+    """Parse frontmatter from disk without consulting the cache."""
+    # Read raw bytes once and decode in memory - the latin-1 fallback
+    # then costs no second disk read
+    try:
+        data = file_path.read_bytes()
+    except Exception as e:
+        raise FrontmatterError(f"Cannot read file: {e}") from e
+
+    return parse_frontmatter_bytes(data, source=str(file_path))
+
+
+def parse_frontmatter_bytes(
+    data: bytes, source: str = "<bytes>"
+) -> Tuple[Optional[FrontmatterData], str]:
+    """
+    Parse YAML frontmatter from in-memory Markdown bytes.
+
+    Handles BOM stripping and the UTF-8 -> latin-1 decoding fallback the
+    same way as parse_frontmatter, without touching the filesystem.
+
+    Args:
+        data: Raw Markdown file content.
+        source: Label used in log messages (e.g., the originating path).
+
+    Returns:
+        Tuple of (FrontmatterData or None, remaining markdown content).
+
+    Raises:
+        FrontmatterError: If frontmatter is malformed.
+    """
+    if data.startswith(b"\xef\xbb\xbf"):
+        data = data[3:]
+
     try:
-        content = file_path.read_text(encoding="utf-8-sig")
+        content = data.decode("utf-8")
     except UnicodeDecodeError:
-        # Fallback to latin-1 for non-UTF8 files
+        # Fallback to latin-1 for non-UTF8 files (cannot fail - latin-1
+        # maps every byte value)
         logger.warning(
-            f"UTF-8 decoding failed for {file_path}, trying latin-1 encoding"
+            "UTF-8 decoding failed for %s, trying latin-1 encoding",
+            source,
         )
-        try:
-            content = file_path.read_text(encoding="latin-1")
-        except Exception as e:
-            raise FrontmatterError(f"Cannot read file with any encoding: {e}") from e
-    except Exception as e:
-        raise FrontmatterError(f"Cannot read file: {e}") from e
+        content = data.decode("latin-1")
 
     # Remove UTF-8 BOM if present (utf-8-sig handles most cases)
     if content.startswith("\ufeff"):
@@ -114,29 +207,38 @@ def parse_frontmatter(file_path: Path) -> Tuple[Optional[FrontmatterData], str]:
     if not content.startswith("---"):
         return None, content
 
-    # Find the closing delimiter
-    lines = content.splitlines()
-    if len(lines) < 2:
+    # Find the closing delimiter by scanning the raw string instead of
+    # materializing a list of line objects and re-joining two halves
+    start = content.find("\n") + 1
+    if start == 0:
+        # Single line, no closing delimiter possible
         return None, content
 
-    # Look for closing ---
-    end_idx = None
-    for i in range(1, len(lines)):
-        if lines[i].strip() == "---":
-            end_idx = i
+    # Walk line starts via str.find instead of materializing a line list.
+    # The delimiter line may carry leading/trailing whitespace or a CR,
+    # so each line is compared stripped (as the line-based parser did).
+    end_start = None
+    end_line_end = -1
+    pos = start
+    length = len(content)
+    while pos < length:
+        line_end = content.find("\n", pos)
+        if line_end < 0:
+            line_end = length
+        if content[pos:line_end].strip() == "---":
+            end_start = pos
+            end_line_end = line_end
             break
+        pos = line_end + 1
 
-    if end_idx is None:
+    if end_start is None:
         # No closing delimiter found, treat as no frontmatter
         logger.debug("Frontmatter start found but no closing delimiter")
         return None, content
 
-    # Extract frontmatter YAML
-    frontmatter_lines = lines[1:end_idx]
-    frontmatter_yaml = "\n".join(frontmatter_lines)
-
-    # Extract remaining content
-    remaining_content = "\n".join(lines[end_idx + 1 :])
+    # Extract frontmatter YAML and remaining content as two slices
+    frontmatter_yaml = content[start:end_start]
+    remaining_content = content[end_line_end + 1:]
 
     # Parse YAML (simple parser, no external dependency)
     try:
@@ -148,7 +250,8 @@ def parse_frontmatter(file_path: Path) -> Tuple[Optional[FrontmatterData], str]:
     validated_data = _validate_frontmatter(data)
 
     frontmatter = FrontmatterData(validated_data)
-    logger.debug(f"Parsed frontmatter: {frontmatter.to_dict()}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Parsed frontmatter: %s", frontmatter.to_dict())
 
     return frontmatter, remaining_content
 
@@ -173,7 +276,7 @@ def _parse_simple_yaml(yaml_text: str) -> Dict[str, str]:
             continue
 
         # Match key: value pattern
-        match = re.match(r"^([a-zA-Z_][a-zA-Z0-9_]*)\s*:\s*(.*)$", stripped)
+        match = _YAML_LINE_RE.match(stripped)
         if not match:
             raise ValueError(f"Invalid frontmatter line: {line}")
 
@@ -181,10 +284,9 @@ def _parse_simple_yaml(yaml_text: str) -> Dict[str, str]:
         value = match.group(2).strip()
 
         # Remove quotes if present
-        if (value.startswith('"') and value.endswith('"')) or (
-            value.startswith("'") and value.endswith("'")
-        ):
-            value = value[1:-1]
+        quoted = _QUOTE_RE.match(value)
+        if quoted:
+            value = quoted.group(2)
 
         result[key] = value
 
@@ -200,25 +302,13 @@ def _validate_frontmatter(data: Dict[str, str]) -> Dict[str, str]:
 
     Returns:
         Validated and normalized data dictionary.
-
-    Raises:
-        FrontmatterError: If validation fails.
     """
     validated = {}
 
-    for key, expected_type in FRONTMATTER_FIELDS.items():
-        if key not in data:
-            continue
-
-        value = data[key]
-        if isinstance(value, str):
-            value = value.strip()
-
-        # Type validation
-        if not isinstance(value, str):
-            raise FrontmatterError(
-                f"Frontmatter field '{key}' must be a string, got {type(value)}"
-            )
+    # C-level set intersection instead of a membership test per known
+    # field; _parse_simple_yaml only produces strings, so no type checks
+    for key in FRONTMATTER_FIELDS.keys() & data.keys():
+        value = data[key].strip()
 
         # Special handling for date field
         if key == "date":
@@ -229,7 +319,8 @@ def _validate_frontmatter(data: Dict[str, str]) -> Dict[str, str]:
                     validated[key] = normalized_date
                 else:
                     logger.warning(
-                        f"Could not parse date '{value}', using as-is"
+                        "Could not parse date '%s', using as-is",
+                        value,
                     )
                     validated[key] = value
             else:
@@ -256,16 +347,11 @@ def _normalize_date(date_str: str) -> Optional[str]:
     if not date_str:
         return None
 
-    # Try common date formats
-    formats = [
-        "%Y-%m-%d",
-        "%d.%m.%Y",
-        "%d/%m/%Y",
-        "%Y/%m/%d",
-        "%d-%m-%Y",
-    ]
+    # Already in target format - skip strptime entirely
+    if _ISO_DATE.fullmatch(date_str):
+        return date_str
 
-    for fmt in formats:
+    for fmt in _DATE_FORMATS:
         try:
             parsed = datetime.strptime(date_str, fmt)
             return parsed.strftime("%Y-%m-%d")
@@ -150,24 +150,25 @@ def apply_landscape_sections(
 
         if start_idx is None:
             logger.warning(
-                f"Landscape start marker not found: '{ls.start_marker}'"
+                "Landscape start marker not found: '%s'",
+                ls.start_marker,
             )
             continue
         if end_idx is None:
             logger.warning(
-                f"Landscape end marker not found: '{ls.end_marker}'"
+                "Landscape end marker not found: '%s'",
+                ls.end_marker,
             )
             continue
         if start_idx >= end_idx:
             logger.warning(
-                f"Start marker ({start_idx}) must be before "
-                f"end marker ({end_idx})"
+                "Start marker (%s) must be before end marker (%s)",
+                start_idx,
+                end_idx,
             )
             continue
 
-        logger.info(
-            f"Landscape section: paragraphs {start_idx}-{end_idx}"
-        )
+        logger.info("Landscape section: paragraphs %s-%s", start_idx, end_idx)
 
         # Section break BEFORE landscape (ends portrait)
         prev_elem = doc.paragraphs[start_idx - 1]._element
@@ -191,8 +192,6 @@ def apply_landscape_sections(
     if applied:
         doc.save(str(docx_path))
         n_sections = len(doc.sections)
-        logger.info(
-            f"Saved with {n_sections} sections: {docx_path.name}"
-        )
+        logger.info("Saved with %s sections: %s", n_sections, docx_path.name)
 
     return applied
@@ -3,12 +3,14 @@ Mermaid diagram processor for md_converter.
 Converts Mermaid code blocks to SVG/PNG images before Pandoc conversion.
 """
 
+import functools
 import hashlib
 import logging
+import os
 import re
 import shutil
-import subprocess
-import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -17,20 +19,33 @@ from .errors import MermaidRenderError
 logger = logging.getLogger(__name__)
 
 
-# Regex pattern to find mermaid code blocks
+# Regex pattern to find mermaid code blocks. Anchored to line starts
+# (CommonMark fence semantics) so stray backticks in prose cannot trigger
+# quadratic backtracking on the lazy body match
 MERMAID_PATTERN = re.compile(
-    r'```mermaid\s*\n(.*?)\n```',
-    re.DOTALL | re.IGNORECASE
+    r'^```mermaid[^\n]*\n([\s\S]*?)\n```\s*$',
+    re.MULTILINE | re.IGNORECASE
 )
 
+DEFAULT_WIDTH = 800
+DEFAULT_BACKGROUND = "white"
 DEFAULT_PNG_DPI = 300
 DEFAULT_PNG_SCALE = DEFAULT_PNG_DPI / 96.0
 
+# Bump to invalidate the cross-document diagram cache (e.g. after
+# changing how diagrams are rendered)
+CACHE_VERSION = 1
 
+
+@functools.lru_cache(maxsize=1)
 def find_mermaid_cli() -> Optional[str]:
     """
     Find the Mermaid CLI executable (mmdc).
 
+    The result is cached for the process - the PATH scan and Windows
+    fallback stats run once instead of per conversion. Tests that mock
+    PATH lookup should call find_mermaid_cli.cache_clear().
+
     Returns:
         Path to mmdc executable, or None if not found.
     """
@@ -66,6 +81,10 @@ def has_mermaid_diagrams(content: str) -> bool:
     Returns:
         True if Mermaid blocks are found.
     """
+    # Cheap substring scan first - most files contain no diagrams, and
+    # the C-level find is much faster than the DOTALL regex
+    if "```mermaid" not in content.lower():
+        return False
     return bool(MERMAID_PATTERN.search(content))
 
 
@@ -79,28 +98,202 @@ def extract_mermaid_blocks(content: str) -> List[Tuple[str, str]]:
     Returns:
         List of tuples (full_match, diagram_code).
     """
+    lowered = content.lower()
+    if "```mermaid" not in lowered:
+        return []
+
+    # Two-pass str.find scan instead of the lazy DOTALL regex - the
+    # C-level substring search avoids per-character regex bookkeeping
+    # on large documents
     matches = []
-    for match in MERMAID_PATTERN.finditer(content):
-        full_match = match.group(0)
-        diagram_code = match.group(1).strip()
+    fence_len = len("```mermaid")
+    pos = 0
+    while True:
+        start = lowered.find("```mermaid", pos)
+        if start < 0:
+            break
+        newline = content.find("\n", start)
+        if newline < 0:
+            break
+        # Only whitespace may follow the fence on its opening line
+        if content[start + fence_len:newline].strip():
+            pos = start + fence_len
+            continue
+        end = content.find("\n```", newline + 1)
+        if end < 0:
+            break
+        full_match = content[start:end + 4]
+        diagram_code = content[newline + 1:end].strip()
         matches.append((full_match, diagram_code))
+        pos = end + 4
     return matches
 
 
+@functools.lru_cache(maxsize=1024)
 def _hash_mermaid_code(diagram_code: str) -> str:
-    """Create a stable hash based on Mermaid diagram content."""
+    """
+    Create a stable hash based on Mermaid diagram content.
+
+    Cached so re-processing a document (or repeated diagrams) never
+    re-hashes identical code.
+    """
     return hashlib.sha256(diagram_code.encode("utf-8")).hexdigest()
 
 
+def _global_cache_dir() -> Path:
+    """
+    Resolve the cross-document diagram cache directory.
+
+    Cached images survive across documents and working directories, so an
+    unchanged diagram never launches mmdc again even in a fresh project.
+    """
+    base = os.environ.get("XDG_CACHE_HOME")
+    if base:
+        root = Path(base)
+    elif os.name == "nt":
+        local_appdata = os.environ.get("LOCALAPPDATA")
+        root = Path(local_appdata) if local_appdata else (
+            Path.home() / "AppData" / "Local"
+        )
+    else:
+        root = Path.home() / ".cache"
+    return root / "md_converter" / "diagrams"
+
+
+@functools.lru_cache(maxsize=None)
+def _mmdc_version(mmdc_path: str) -> str:
+    """Return the mmdc version string (cached; empty if unavailable)."""
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            [mmdc_path, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        return (result.stdout or "").strip()
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+
+
+def _cache_name(
+    diagram_code: str,
+    suffix: str,
+    width: int,
+    background: str,
+    png_scale: float,
+    mmdc_path: str
+) -> str:
+    """Content-addressed cache filename including all render parameters."""
+    key = (
+        f"{CACHE_VERSION}|{_mmdc_version(mmdc_path)}|"
+        f"{width}|{background}|{png_scale}|{diagram_code}"
+    )
+    return f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.{suffix}"
+
+
+def _tmp_sibling(target: Path) -> Path:
+    """
+    Unique temp path next to target for atomic materialization.
+
+    Staying in the target's directory keeps os.replace atomic (same
+    filesystem), and the real suffix comes last because mmdc derives the
+    output format from it.
+    """
+    return target.with_name(f"{target.stem}.{uuid.uuid4().hex}.tmp{target.suffix}")
+
+
+def _copy_from_cache(cache_dir: Path, name: str, target: Path) -> bool:
+    """Materialize a cached image at target. Returns True on a cache hit.
+
+    Prefers a zero-copy hardlink (cache entries are never modified in
+    place, and cleanup unlinks the link without touching the cache);
+    falls back to a byte copy across filesystems or on Windows. The
+    image lands via a unique temp name and os.replace - hash-addressed
+    targets are shared between documents, so a parallel worker may be
+    reading target while this one materializes it.
+    """
+    try:
+        cached = cache_dir / name
+        if cached.exists():
+            tmp = _tmp_sibling(target)
+            try:
+                try:
+                    os.link(cached, tmp)
+                except OSError:
+                    shutil.copyfile(cached, tmp)
+                os.replace(tmp, target)
+            except OSError:
+                if tmp.exists():
+                    try:
+                        tmp.unlink()
+                    except OSError:
+                        pass
+                raise
+            logger.debug("Mermaid cache hit: %s", name)
+            return True
+    except OSError as e:
+        logger.debug("Mermaid cache read failed for %s: %s", name, e)
+    return False
+
+
+def _store_in_cache(source: Path, cache_dir: Path, name: str) -> None:
+    """Store a rendered image in the cache (atomically, best-effort).
+
+    The temp name is uuid-based: a pid-only suffix collides between
+    threads of the same process (batch and UI pools), letting one thread
+    replace another's half-written copy into the persistent cache.
+    """
+    tmp = cache_dir / f"{name}.{uuid.uuid4().hex}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, tmp)
+        os.replace(tmp, cache_dir / name)
+    except OSError as e:
+        logger.debug("Mermaid cache write failed for %s: %s", name, e)
+        if tmp.exists():
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+
+# Whether the installed mmdc accepts diagram code on stdin ("-i -").
+# Learned on first use; None means "not probed yet".
+_mmdc_stdin_supported: Optional[bool] = None
+
+
+def _error_indicates_stdin_unsupported(message: str) -> bool:
+    """
+    Whether an mmdc error points at the "-i -" argument itself.
+
+    Older mmdc versions treat "-" as a literal input filename (ENOENT on
+    '-') or reject it at argument parsing. Diagram syntax errors produce
+    mermaid parse messages instead and must not disable the stdin path.
+    """
+    lowered = message.lower()
+    return (
+        "'-'" in message
+        or '"-"' in message
+        or "unknown argument" in lowered
+        or "unknown option" in lowered
+    )
+
+
 def _run_mermaid_cli(
     cmd: List[str],
-    output_path: Path
+    output_path: Path,
+    input_text: Optional[str] = None
 ) -> None:
+    import subprocess
+
     result = subprocess.run(
         cmd,
         capture_output=True,
         text=True,
-        timeout=30
+        timeout=30,
+        input=input_text
     )
 
     if result.returncode != 0:
@@ -118,12 +311,16 @@ def render_mermaid_to_svg_and_png(
     svg_path: Path,
     png_path: Path,
     mmdc_path: Optional[str] = None,
-    width: int = 800,
-    background: str = "white",
-    png_scale: float = DEFAULT_PNG_SCALE
+    width: int = DEFAULT_WIDTH,
+    background: str = DEFAULT_BACKGROUND,
+    png_scale: float = DEFAULT_PNG_SCALE,
+    formats: Tuple[str, ...] = ("svg", "png")
 ) -> None:
     """
-    Render a Mermaid diagram to SVG and PNG.
+    Render a Mermaid diagram to SVG and/or PNG.
+
+    Unchanged diagrams are served from the cross-document cache instead
+    of launching mmdc.
 
     Args:
         diagram_code: Mermaid diagram code.
@@ -133,6 +330,8 @@ def render_mermaid_to_svg_and_png(
         width: Width of the output image.
         background: Background color.
         png_scale: Scale factor for PNG rendering.
+        formats: Which outputs to produce ("svg" and/or "png"). Passing
+            only the format the conversion embeds halves the mmdc cost.
 
     Raises:
         MermaidRenderError: If rendering fails or mmdc is not installed.
@@ -145,41 +344,46 @@ def render_mermaid_to_svg_and_png(
             "Mermaid CLI (mmdc) not found – diagrams cannot be rendered."
         )
 
-    # Create temporary input file for mermaid code
-    with tempfile.NamedTemporaryFile(
-        mode='w',
-        suffix='.mmd',
-        delete=False,
-        encoding='utf-8'
-    ) as f:
-        f.write(diagram_code)
-        input_file = Path(f.name)
+    need_svg = "svg" in formats
+    need_png = "png" in formats
+
+    # Serve unchanged diagrams from the cross-document cache
+    cache_dir = _global_cache_dir()
+    svg_cache_name = _cache_name(
+        diagram_code, "svg", width, background, png_scale, mmdc_path
+    )
+    png_cache_name = _cache_name(
+        diagram_code, "png", width, background, png_scale, mmdc_path
+    )
+    if need_svg and not svg_path.exists():
+        _copy_from_cache(cache_dir, svg_cache_name, svg_path)
+    if need_png and not png_path.exists():
+        _copy_from_cache(cache_dir, png_cache_name, png_path)
+    if (not need_svg or svg_path.exists()) and (
+        not need_png or png_path.exists()
+    ):
+        return
+
+    import subprocess
 
     try:
-        if not svg_path.exists():
-            cmd = [
+        if need_svg and not svg_path.exists():
+            _render_diagram_atomic(
                 mmdc_path,
-                "-i", str(input_file),
-                "-o", str(svg_path),
-                "-w", str(width),
-                "-b", background,
-                "--quiet"
-            ]
-            logger.debug(f"Running Mermaid CLI (svg): {' '.join(cmd)}")
-            _run_mermaid_cli(cmd, svg_path)
-
-        if not png_path.exists():
-            cmd = [
+                diagram_code,
+                svg_path,
+                ["-w", str(width), "-b", background],
+            )
+            _store_in_cache(svg_path, cache_dir, svg_cache_name)
+
+        if need_png and not png_path.exists():
+            _render_diagram_atomic(
                 mmdc_path,
-                "-i", str(input_file),
-                "-o", str(png_path),
-                "-w", str(width),
-                "-b", background,
-                "--scale", str(png_scale),
-                "--quiet"
-            ]
-            logger.debug(f"Running Mermaid CLI (png): {' '.join(cmd)}")
-            _run_mermaid_cli(cmd, png_path)
+                diagram_code,
+                png_path,
+                ["-w", str(width), "-b", background, "--scale", str(png_scale)],
+            )
+            _store_in_cache(png_path, cache_dir, png_cache_name)
 
     except subprocess.TimeoutExpired:
         raise MermaidRenderError("Mermaid rendering timed out after 30 seconds")
@@ -187,12 +391,211 @@ def render_mermaid_to_svg_and_png(
         raise MermaidRenderError(
             "Mermaid CLI (mmdc) not found – diagrams cannot be rendered."
         )
+
+
+def _render_diagram_atomic(
+    mmdc_path: str,
+    diagram_code: str,
+    target: Path,
+    args: List[str]
+) -> None:
+    """
+    Render one diagram into target via a unique temp sibling.
+
+    Hash-addressed targets are shared between documents, so parallel
+    batch workers can materialize the same path concurrently - possibly
+    while another worker's pandoc is already reading it. Rendering to a
+    temp name and os.replace()-ing keeps readers from ever seeing a
+    partially written image.
+
+    Raises:
+        MermaidRenderError: If rendering fails.
+    """
+    tmp = _tmp_sibling(target)
+    try:
+        _invoke_mmdc(mmdc_path, diagram_code, tmp, args)
+        os.replace(tmp, target)
+    finally:
+        if tmp.exists():
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+
+def _invoke_mmdc(
+    mmdc_path: str,
+    diagram_code: str,
+    output_path: Path,
+    args: List[str]
+) -> None:
+    """
+    Run mmdc for one output file.
+
+    Streams the diagram code over stdin ("-i -") when the installed mmdc
+    supports it, avoiding a temp-file write/unlink per invocation; falls
+    back to a temporary input file otherwise and remembers the answer.
+
+    Raises:
+        MermaidRenderError: If rendering fails.
+    """
+    global _mmdc_stdin_supported
+
+    if _mmdc_stdin_supported is not False:
+        cmd = [mmdc_path, "-i", "-", "-o", str(output_path)] + args + ["--quiet"]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running Mermaid CLI (stdin): %s", ' '.join(cmd))
+        try:
+            _run_mermaid_cli(cmd, output_path, input_text=diagram_code)
+            _mmdc_stdin_supported = True
+            return
+        except MermaidRenderError as e:
+            # Only disable the stdin path when the error blames "-i -";
+            # a broken diagram on the first-ever render must propagate
+            # instead of relaunching mmdc just to fail again
+            if _mmdc_stdin_supported or not _error_indicates_stdin_unsupported(
+                str(e)
+            ):
+                raise
+            logger.debug(
+                "mmdc did not accept stdin input; falling back to a temp file"
+            )
+            _mmdc_stdin_supported = False
+
+    import tempfile
+
+    # Create temporary input file for mermaid code. Written in binary
+    # mode with pre-encoded bytes to skip the TextIOWrapper layer
+    with tempfile.NamedTemporaryFile(
+        mode='wb',
+        suffix='.mmd',
+        delete=False
+    ) as f:
+        f.write(diagram_code.encode("utf-8"))
+        input_file = Path(f.name)
+
+    try:
+        cmd = [
+            mmdc_path,
+            "-i", str(input_file),
+            "-o", str(output_path),
+        ] + args + ["--quiet"]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running Mermaid CLI: %s", ' '.join(cmd))
+        _run_mermaid_cli(cmd, output_path)
     finally:
         # Clean up temporary input file
         if input_file.exists():
             input_file.unlink()
 
 
+def _render_mermaid_batch(
+    entries: List[Tuple[str, Path, Path]],
+    mmdc_path: str,
+    width: int = DEFAULT_WIDTH,
+    background: str = DEFAULT_BACKGROUND,
+    png_scale: float = DEFAULT_PNG_SCALE,
+    formats: Tuple[str, ...] = ("svg", "png")
+) -> None:
+    """
+    Render several Mermaid diagrams with one mmdc invocation per format.
+
+    mmdc's markdown mode renders every fenced mermaid block in a single
+    browser launch, so N diagrams cost one launch per requested format
+    instead of one per diagram and format. The emitted images are
+    numbered in block order and moved to the hash-based target paths.
+
+    Args:
+        entries: List of tuples (diagram_code, svg_path, png_path).
+        mmdc_path: Path to mmdc executable.
+        width: Width of the output images.
+        background: Background color.
+        png_scale: Scale factor for PNG rendering.
+        formats: Which outputs to produce ("svg" and/or "png").
+
+    Raises:
+        MermaidRenderError: If the batch invocation fails or does not
+            produce the expected images. Callers fall back to
+            per-diagram rendering.
+    """
+    import subprocess
+    import tempfile
+
+    with tempfile.TemporaryDirectory(prefix="mermaid_batch_") as tdir:
+        tmp_dir = Path(tdir)
+        input_file = tmp_dir / "diagrams.md"
+        input_file.write_text(
+            "\n\n".join(f"```mermaid\n{code}\n```" for code, _, _ in entries),
+            encoding="utf-8",
+        )
+
+        format_args = {"svg": [], "png": ["--scale", str(png_scale)]}
+        for fmt in formats:
+            extra_args = format_args[fmt]
+            output_md = tmp_dir / f"out_{fmt}.md"
+            cmd = [
+                mmdc_path,
+                "-i", str(input_file),
+                "-o", str(output_md),
+                "-e", fmt,
+                "-w", str(width),
+                "-b", background,
+                "--quiet"
+            ] + extra_args
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Running Mermaid CLI (batch %s): %s", fmt, ' '.join(cmd)
+                )
+
+            try:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=30 * len(entries)
+                )
+            except subprocess.TimeoutExpired:
+                raise MermaidRenderError("Batch Mermaid rendering timed out")
+            except OSError as e:
+                raise MermaidRenderError(
+                    f"Batch Mermaid rendering failed to start: {e}"
+                ) from e
+
+            if result.returncode != 0:
+                error_msg = result.stderr or result.stdout or "Unknown error"
+                raise MermaidRenderError(
+                    f"Batch Mermaid rendering failed: {error_msg}"
+                )
+
+            # mmdc emits out_<fmt>-1.<fmt>, out_<fmt>-2.<fmt>, ... in block order
+            cache_dir = _global_cache_dir()
+            for i, (diagram_code, svg_path, png_path) in enumerate(entries, start=1):
+                produced = tmp_dir / f"out_{fmt}-{i}.{fmt}"
+                if not produced.exists():
+                    raise MermaidRenderError(
+                        f"Batch Mermaid rendering did not produce: {produced.name}"
+                    )
+                target = svg_path if fmt == "svg" else png_path
+                # Land atomically - another worker may be reading target
+                tmp = _tmp_sibling(target)
+                try:
+                    shutil.copyfile(produced, tmp)
+                    os.replace(tmp, target)
+                finally:
+                    if tmp.exists():
+                        try:
+                            tmp.unlink()
+                        except OSError:
+                            pass
+                _store_in_cache(
+                    target,
+                    cache_dir,
+                    _cache_name(
+                        diagram_code, fmt, width, background, png_scale, mmdc_path
+                    ),
+                )
+
+
 def process_mermaid_in_markdown(
     content: str,
     base_dir: Path,
@@ -229,26 +632,116 @@ def process_mermaid_in_markdown(
 
     blocks = extract_mermaid_blocks(content)
     generated_images: List[Path] = []
-    processed_content = content
 
-    for i, (full_match, diagram_code) in enumerate(blocks, start=1):
+    plan = []
+    for full_match, diagram_code in blocks:
         diagram_hash = _hash_mermaid_code(diagram_code)
         svg_path = output_dir / f"{diagram_hash}.svg"
         png_path = output_dir / f"{diagram_hash}.png"
+        plan.append((full_match, diagram_code, svg_path, png_path))
+
+    # Only one format is embedded in the output (SVG for PDF, PNG for
+    # DOCX), so only that one is rendered - halving the mmdc cost
+    needed_format = "svg" if output_format == "pdf" else "png"
+
+    # Render all uncached diagrams with one browser launch instead of
+    # one per diagram; deduplicate identical blocks by target. The
+    # cross-document cache is consulted before scheduling a render.
+    cache_dir = _global_cache_dir()
+    to_render = {}
+    for _, diagram_code, svg_path, png_path in plan:
+        needed_path = svg_path if needed_format == "svg" else png_path
+        if not needed_path.exists():
+            _copy_from_cache(
+                cache_dir,
+                _cache_name(
+                    diagram_code, needed_format,
+                    DEFAULT_WIDTH, DEFAULT_BACKGROUND, DEFAULT_PNG_SCALE,
+                    mmdc_path,
+                ),
+                needed_path,
+            )
+        if not needed_path.exists():
+            to_render[needed_path] = (diagram_code, svg_path, png_path)
+    batch_rendered = False
+    if len(to_render) > 1:
+        try:
+            logger.info(
+                "Rendering %s Mermaid diagram(s) in one mmdc batch",
+                len(to_render),
+            )
+            _render_mermaid_batch(
+                list(to_render.values()),
+                mmdc_path,
+                formats=(needed_format,),
+            )
+            batch_rendered = True
+        except MermaidRenderError as e:
+            logger.warning(
+                "Batch Mermaid rendering failed (%s); "
+                "falling back to per-diagram rendering",
+                e,
+            )
+
+    if not batch_rendered and to_render:
+        entries = list(to_render.values())
+        for i, (_, svg_path, _) in enumerate(entries, start=1):
+            logger.info(
+                "Rendering Mermaid diagram %s/%s: %s",
+                i,
+                len(entries),
+                svg_path.stem,
+            )
+        # Each render spends ~all its time waiting on a Chromium
+        # subprocess, so threads give near-linear speedup
+        max_workers = min(8, os.cpu_count() or 1, len(entries))
+        if max_workers <= 1:
+            for diagram_code, svg_path, png_path in entries:
+                render_mermaid_to_svg_and_png(
+                    diagram_code,
+                    svg_path,
+                    png_path,
+                    mmdc_path,
+                    formats=(needed_format,)
+                )
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        render_mermaid_to_svg_and_png,
+                        diagram_code,
+                        svg_path,
+                        png_path,
+                        mmdc_path,
+                        formats=(needed_format,),
+                    )
+                    for diagram_code, svg_path, png_path in entries
+                ]
+                # Wait in submission order; the first failure propagates
+                for future in futures:
+                    future.result()
+
+    # Substitute image references in one left-to-right pass instead of
+    # one whole-string str.replace per block (O(N) instead of O(N*M))
+    parts = []
+    cursor = 0
+    for full_match, diagram_code, svg_path, png_path in plan:
+        image_path = svg_path if needed_format == "svg" else png_path
+        generated_images.append(image_path)
 
-        logger.info(f"Rendering Mermaid diagram {i}/{len(blocks)}: {diagram_hash}")
-        render_mermaid_to_svg_and_png(
-            diagram_code,
-            svg_path,
-            png_path,
-            mmdc_path
-        )
-        generated_images.extend([svg_path, png_path])
-
-        image_path = svg_path if output_format == "pdf" else png_path
         relative_path = image_path.relative_to(base_dir)
         image_ref = f"![]({relative_path.as_posix()})"
-        processed_content = processed_content.replace(full_match, image_ref, 1)
+
+        # Blocks come from extract_mermaid_blocks in document order, so
+        # the next occurrence is always at or after the cursor
+        index = content.find(full_match, cursor)
+        if index < 0:
+            continue
+        parts.append(content[cursor:index])
+        parts.append(image_ref)
+        cursor = index + len(full_match)
+    parts.append(content[cursor:])
+    processed_content = "".join(parts)
 
     return processed_content, generated_images
 
@@ -264,6 +757,6 @@ def cleanup_generated_images(images: List[Path]) -> None:
         try:
             if image_path.exists():
                 image_path.unlink()
-                logger.debug(f"Cleaned up: {image_path}")
+                logger.debug("Cleaned up: %s", image_path)
         except OSError as e:
-            logger.warning(f"Failed to clean up {image_path}: {e}")
+            logger.warning("Failed to clean up %s: %s", image_path, e)
@@ -3,6 +3,7 @@
 import logging
 import re
 import shutil
+import stat
 import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -15,6 +16,10 @@ from converter.errors import (
 
 logger = logging.getLogger(__name__)
 
+# Metadata sanitization helpers, built once at import
+_NL_TABLE = str.maketrans({"\n": " ", "\r": " "})
+_MULTI_SPACE_RE = re.compile(r" +")
+
 
 class PandocWrapper:
     """Wraps Pandoc command-line calls for Markdown to DOCX conversion."""
@@ -28,7 +33,57 @@ class PandocWrapper:
                         If None, searches for 'pandoc' in PATH.
         """
         self.pandoc_path = self._find_pandoc(pandoc_path)
-        logger.info(f"Using Pandoc at: {self.pandoc_path}")
+        # Per-instance caches so engine/version detection runs at most once
+        self._version: Optional[str] = None
+        self._engine_available: Dict[str, bool] = {}
+        self._pdf_engine_cache: Dict[Optional[str], str] = {}
+        logger.info("Using Pandoc at: %s", self.pandoc_path)
+
+    def warm_up(
+        self, need_pdf: bool = False, pdf_engine: Optional[str] = None
+    ) -> None:
+        """
+        Pre-resolve external tool state before a batch run.
+
+        Probes the pandoc executable and, if PDF output is requested,
+        resolves the PDF engine once - so a misconfigured setup fails fast
+        instead of erroring on every file.
+
+        Args:
+            need_pdf: Whether PDF output will be requested.
+            pdf_engine: Optional preferred PDF engine.
+
+        Raises:
+            PandocNotFoundError: If pandoc is not runnable.
+            PDFEngineNotFoundError: If PDF output is needed but no engine exists.
+        """
+        self.get_version()
+        if need_pdf:
+            self._find_pdf_engine(pdf_engine)
+
+    def get_version(self) -> str:
+        """
+        Return the Pandoc version line (cached after the first call).
+
+        Raises:
+            PandocNotFoundError: If pandoc cannot be executed.
+        """
+        if self._version is None:
+            try:
+                result = subprocess.run(
+                    [self.pandoc_path, "--version"],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+            except (subprocess.CalledProcessError, OSError) as e:
+                raise PandocNotFoundError(
+                    f"Pandoc at {self.pandoc_path} is not runnable: {e}"
+                ) from e
+            lines = (result.stdout or "").splitlines()
+            self._version = lines[0] if lines else ""
+            logger.debug("Pandoc version: %s", self._version)
+        return self._version
 
     def _find_pandoc(self, pandoc_path: Optional[str]) -> str:
         """
@@ -70,12 +125,16 @@ class PandocWrapper:
         Returns:
             True if engine is available, False otherwise.
         """
+        if engine in self._engine_available:
+            return self._engine_available[engine]
+
         engine_cmd = shutil.which(engine)
         if engine_cmd:
-            logger.debug(f"PDF engine '{engine}' found at: {engine_cmd}")
-            return True
-        logger.debug(f"PDF engine '{engine}' not found in PATH")
-        return False
+            logger.debug("PDF engine '%s' found at: %s", engine, engine_cmd)
+        else:
+            logger.debug("PDF engine '%s' not found in PATH", engine)
+        self._engine_available[engine] = engine_cmd is not None
+        return engine_cmd is not None
 
     def _sanitize_metadata_value(self, value: str) -> Optional[str]:
         """
@@ -87,17 +146,12 @@ class PandocWrapper:
         Returns:
             Sanitized value or None if value is empty after sanitization.
         """
-        # Ensure value is a string
-        value = str(value)
-
-        # Replace newlines and carriage returns with spaces
-        value = value.replace("\n", " ").replace("\r", " ")
-
-        # Normalize multiple spaces to single space
-        value = re.sub(r" +", " ", value)
+        # Ensure value is a string, then replace newlines and carriage
+        # returns with spaces in one C-level translate pass
+        value = str(value).translate(_NL_TABLE)
 
-        # Trim whitespace
-        value = value.strip()
+        # Normalize multiple spaces to single space and trim
+        value = _MULTI_SPACE_RE.sub(" ", value).strip()
 
         # Return None if empty (will be skipped)
         if not value:
@@ -120,6 +174,9 @@ class PandocWrapper:
         Raises:
             PDFEngineNotFoundError: If no PDF engine is available.
         """
+        if preferred_engine in self._pdf_engine_cache:
+            return self._pdf_engine_cache[preferred_engine]
+
         engines_to_try = []
         if preferred_engine:
             engines_to_try.append(preferred_engine)
@@ -132,7 +189,8 @@ class PandocWrapper:
 
         for engine in engines_to_try:
             if self._check_pdf_engine(engine):
-                logger.info(f"Using PDF engine: {engine}")
+                logger.info("Using PDF engine: %s", engine)
+                self._pdf_engine_cache[preferred_engine] = engine
                 return engine
 
         # No engine found
@@ -171,10 +229,15 @@ class PandocWrapper:
             ConversionError: If the conversion fails.
             PDFEngineNotFoundError: If PDF format requested but no engine available.
         """
-        if not input_file.exists():
-            raise ConversionError(f"Input file does not exist: {input_file}")
+        # Validate with a single stat instead of exists() + is_file()
+        try:
+            input_stat = input_file.stat()
+        except FileNotFoundError as e:
+            raise ConversionError(
+                f"Input file does not exist: {input_file}"
+            ) from e
 
-        if not input_file.is_file():
+        if not stat.S_ISREG(input_stat.st_mode):
             raise ConversionError(f"Input path is not a file: {input_file}")
 
         output_format = output_format.lower()
@@ -189,16 +252,20 @@ class PandocWrapper:
         else:
             engine = None
 
+        # Resolve paths once - realpath walks the symlink chain per call
+        input_resolved = str(input_file.resolve())
+        output_resolved = str(output_file.resolve())
+
         # Build Pandoc command
         cmd = [
             self.pandoc_path,
-            str(input_file.resolve()),
+            input_resolved,
             "-f",
             "markdown",
             "-t",
             output_format,
             "-o",
-            str(output_file.resolve()),
+            output_resolved,
         ]
 
         # Add PDF engine if converting to PDF
@@ -209,8 +276,8 @@ class PandocWrapper:
         if template_file and output_format == "docx":
             if not template_file.exists():
                 logger.warning(
-                    f"Template file does not exist: {template_file}. "
-                    "Continuing without template."
+                    "Template file does not exist: %s. Continuing without template.",
+                    template_file,
                 )
             else:
                 cmd.extend(["--reference-doc", str(template_file.resolve())])
@@ -234,10 +301,13 @@ class PandocWrapper:
 
         # Logging: INFO shows summary, DEBUG shows full command
         logger.info(
-            f"Running Pandoc (format={output_format}, "
-            f"input={input_file.name}, output={output_file.name})"
+            "Running Pandoc (format=%s, input=%s, output=%s)",
+            output_format,
+            input_file.name,
+            output_file.name,
         )
-        logger.debug(f"Full Pandoc command: {' '.join(cmd)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Full Pandoc command: %s", ' '.join(cmd))
 
         try:
             result = subprocess.run(
@@ -248,24 +318,21 @@ class PandocWrapper:
             )
 
             # Validate output file was created and has content
-            if not output_file.exists():
-                raise ConversionError(
-                    f"Pandoc completed but output file was not created: {output_file}"
-                )
+            # (single stat instead of exists() + stat())
             try:
-                if output_file.stat().st_size == 0:
-                    raise ConversionError(
-                        f"Pandoc completed but output file is empty: {output_file}"
-                    )
+                output_size = output_file.stat().st_size
             except FileNotFoundError as e:
-                # Race condition: file existed at line 251 but was deleted before stat()
                 raise ConversionError(
-                    f"Output file was deleted after creation: {output_file}"
+                    f"Pandoc completed but output file was not created: {output_file}"
                 ) from e
+            if output_size == 0:
+                raise ConversionError(
+                    f"Pandoc completed but output file is empty: {output_file}"
+                )
 
             logger.info("Conversion completed successfully")
             if result.stdout:
-                logger.debug(f"Pandoc stdout: {result.stdout}")
+                logger.debug("Pandoc stdout: %s", result.stdout)
         except subprocess.CalledProcessError as e:
             stderr = (e.stderr or "").strip()
             stdout = (e.stdout or "").strip()
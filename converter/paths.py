@@ -1,15 +1,25 @@
 """Path and filename utilities."""
 
+import functools
 import re
 import unicodedata
 from pathlib import Path
 from typing import Optional
 
+# Slug patterns, compiled once at import. The strip pattern keeps
+# whitespace so the separator pass can still turn it into hyphens.
+_SLUG_STRIP_RE = re.compile(r"[^\w\s\-]")
+_SLUG_SEP_RE = re.compile(r"[\s_\-]+")
 
+
+@functools.lru_cache(maxsize=1024)
 def slugify(text: str, max_length: int = 100) -> str:
     """
     Convert a string to a URL-safe slug.
 
+    Results are cached - batch conversions slugify the same title once
+    per output format, and repeated titles are common.
+
     Args:
         text: Input text to slugify.
         max_length: Maximum length of the resulting slug.
@@ -26,14 +36,11 @@ def slugify(text: str, max_length: int = 100) -> str:
     # Convert to lowercase
     text = text.lower()
 
-    # Replace spaces and underscores with hyphens
-    text = re.sub(r"[\s_]+", "-", text)
-
-    # Remove all non-alphanumeric characters except hyphens
-    text = re.sub(r"[^\w\-]", "", text)
+    # Remove all non-alphanumeric characters except whitespace and hyphens
+    text = _SLUG_STRIP_RE.sub("", text)
 
-    # Replace multiple hyphens with single hyphen
-    text = re.sub(r"-+", "-", text)
+    # Collapse whitespace, underscore and hyphen runs into single hyphens
+    text = _SLUG_SEP_RE.sub("-", text)
 
     # Remove leading/trailing hyphens
     text = text.strip("-")
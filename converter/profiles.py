@@ -1,5 +1,6 @@
 """Preset profiles for document conversion."""
 
+import functools
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -9,9 +10,48 @@ from converter.errors import ProfileError
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _resolve_template(template_str: str, base_dir: Optional[Path]) -> Optional[Path]:
+    """
+    Resolve a profile template path (cached).
+
+    In batch mode the same profile resolves the same template once per
+    file; caching skips the repeated exists() stats. register_profile
+    clears the cache so freshly created templates are picked up.
+    """
+    template = Path(template_str)
+    if template.is_absolute():
+        return template if template.exists() else None
+
+    if base_dir:
+        resolved = base_dir / template
+        if resolved.exists():
+            return resolved
+
+    # Try relative to current working directory
+    if template.exists():
+        return template.resolve()
+
+    return None
+
+
 class Profile:
     """Represents a conversion profile with default settings."""
 
+    __slots__ = (
+        "name",
+        "display_name",
+        "description",
+        "default_template",
+        "pandoc_args",
+        "output_naming",
+        "default_formats",
+        "toc",
+        "number_sections",
+        "landscape_sections",
+        "render_mermaid",
+    )
+
     def __init__(
         self,
         name: str,
@@ -24,6 +64,7 @@ class Profile:
         toc: bool = False,
         number_sections: bool = False,
         landscape_sections: Optional[List] = None,
+        render_mermaid: bool = True,
     ):
         """
         Initialize a profile.
@@ -38,6 +79,9 @@ class Profile:
             default_formats: Default output formats (e.g., ["docx", "pdf"]).
             toc: Whether to include table of contents.
             number_sections: Whether to number sections.
+            render_mermaid: Whether to render Mermaid diagrams. Disable
+                for profiles that never contain diagrams to skip the
+                per-document scan.
         """
         self.name = name
         self.display_name = display_name or name.capitalize()
@@ -48,13 +92,16 @@ class Profile:
         self.toc = toc
         self.number_sections = number_sections
         self.landscape_sections = landscape_sections or []
+        self.render_mermaid = render_mermaid
 
-        # Build pandoc_args from settings
-        self.pandoc_args = list(pandoc_args or [])
-        if toc and "--toc" not in self.pandoc_args:
-            self.pandoc_args.append("--toc")
-        if number_sections and "--number-sections" not in self.pandoc_args:
-            self.pandoc_args.append("--number-sections")
+        # Build pandoc_args from settings, then freeze - profiles are
+        # shared registry objects and must not be mutated by callers
+        args = list(pandoc_args or [])
+        if toc and "--toc" not in args:
+            args.append("--toc")
+        if number_sections and "--number-sections" not in args:
+            args.append("--number-sections")
+        self.pandoc_args = tuple(args)
 
     def get_template_path(self, base_dir: Optional[Path] = None) -> Optional[Path]:
         """
@@ -69,20 +116,7 @@ class Profile:
         if not self.default_template:
             return None
 
-        template = Path(self.default_template)
-        if template.is_absolute():
-            return template if template.exists() else None
-
-        if base_dir:
-            resolved = base_dir / template
-            if resolved.exists():
-                return resolved
-
-        # Try relative to current working directory
-        if template.exists():
-            return template.resolve()
-
-        return None
+        return _resolve_template(self.default_template, base_dir)
 
 
 # Built-in profiles
@@ -140,40 +174,61 @@ def get_profile(name: str) -> Profile:
     Raises:
         ProfileError: If profile does not exist.
     """
-    if name not in PROFILES:
-        available = ", ".join(PROFILES.keys())
+    # Single dict lookup instead of a membership test plus indexing
+    profile = PROFILES.get(name)
+    if profile is None:
+        # Reuse the cached name tuple instead of re-materializing the keys
+        available = ", ".join(list_profiles())
         raise ProfileError(
             f"Profile '{name}' not found. Available profiles: {available}"
         )
 
-    return PROFILES[name]
+    return profile
+
+
+# Cached profile name tuple and UI listing (invalidated by register_profile)
+_profile_names: Optional[tuple] = None
+_ui_profiles: Optional[tuple] = None
 
 
 def list_profiles() -> List[str]:
     """
     List all available profile names.
 
+    The result is cached per process since the registry only changes via
+    register_profile, which invalidates the cache.
+
     Returns:
         List of profile names.
     """
-    return list(PROFILES.keys())
+    global _profile_names
+    if _profile_names is None:
+        _profile_names = tuple(PROFILES.keys())
+    return list(_profile_names)
 
 
 def list_profiles_for_ui() -> List[Dict[str, str]]:
     """
     List all profiles with display information for UI.
 
+    The dicts are built once per registry state and reused - the UI calls
+    this on every rerun, and the registry only changes via
+    register_profile, which invalidates the cache.
+
     Returns:
         List of dicts with name, display_name, and description.
     """
-    return [
-        {
-            "name": p.name,
-            "display_name": p.display_name,
-            "description": p.description,
-        }
-        for p in PROFILES.values()
-    ]
+    global _ui_profiles
+    if _ui_profiles is None:
+        _ui_profiles = tuple(
+            {
+                "name": p.name,
+                "display_name": p.display_name,
+                "description": p.description,
+            }
+            for p in PROFILES.values()
+        )
+    return list(_ui_profiles)
 
 
 def register_profile(profile: Profile) -> None:
@@ -189,5 +244,11 @@ def register_profile(profile: Profile) -> None:
     if not profile.name:
         raise ProfileError("Profile name cannot be empty")
 
+    global _profile_names, _ui_profiles
     PROFILES[profile.name] = profile
-    logger.info(f"Registered custom profile: {profile.name}")
+    _profile_names = None
+    _ui_profiles = None
+    # Custom profiles may point at templates created just before
+    # registration - drop any cached misses
+    _resolve_template.cache_clear()
+    logger.info("Registered custom profile: %s", profile.name)
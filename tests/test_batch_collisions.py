@@ -21,8 +21,8 @@ def test_batch_collision_same_title(mock_converter_class, mock_parse_frontmatter
         # Create two Markdown files with same title in frontmatter
         md_file1 = input_dir / "file1.md"
         md_file2 = input_dir / "file2.md"
-        md_file1.write_text("# Content 1")
-        md_file2.write_text("# Content 2")
+        md_file1.write_text("---\ntitle: Same Title\n---\n# Content 1")
+        md_file2.write_text("---\ntitle: Same Title\n---\n# Content 2")
 
         # Mock frontmatter parser to return same title for both
         from converter.frontmatter import FrontmatterData
@@ -66,8 +66,8 @@ def test_batch_collision_multiple_formats(mock_converter_class, mock_parse_front
 
         md_file1 = input_dir / "file1.md"
         md_file2 = input_dir / "file2.md"
-        md_file1.write_text("# Content 1")
-        md_file2.write_text("# Content 2")
+        md_file1.write_text("---\ntitle: Same Title\n---\n# Content 1")
+        md_file2.write_text("---\ntitle: Same Title\n---\n# Content 2")
 
         from converter.frontmatter import FrontmatterData
 
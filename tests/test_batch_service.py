@@ -16,7 +16,7 @@ def test_batch_result_initialization():
     assert result.successful == 0
     assert result.skipped == 0
     assert result.failed == 0
-    assert result.errors == []
+    assert list(result.errors) == []
 
 
 def test_batch_result_string():
@@ -5,11 +5,15 @@ from pathlib import Path
 from tempfile import NamedTemporaryFile
 
 from converter.errors import FrontmatterError
-from converter.frontmatter import FrontmatterData, parse_frontmatter
+from converter.frontmatter import (
+    FrontmatterData,
+    parse_frontmatter,
+    parse_frontmatter_bytes,
+)
 
 
 def test_parse_frontmatter_with_yaml():
-    """Test parsing Markdown file with YAML frontmatter."""
+    """Test parsing a Markdown file with YAML frontmatter from disk."""
     content = """---
 title: Test Document
 author: John Doe
@@ -47,24 +51,16 @@ This is the content.
 
 
 def test_parse_frontmatter_without_yaml():
-    """Test parsing Markdown file without frontmatter."""
+    """Test parsing Markdown content without frontmatter."""
     content = """# Content
 
 This is the content.
 """
 
-    with NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-        f.write(content)
-        f.flush()
-        file_path = Path(f.name)
-
-    try:
-        frontmatter, remaining = parse_frontmatter(file_path)
+    frontmatter, remaining = parse_frontmatter_bytes(content.encode("utf-8"))
 
-        assert frontmatter is None
-        assert remaining == content
-    finally:
-        file_path.unlink()
+    assert frontmatter is None
+    assert remaining == content
 
 
 def test_parse_frontmatter_partial_fields():
@@ -77,21 +73,13 @@ author: John Doe
 # Content
 """
 
-    with NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-        f.write(content)
-        f.flush()
-        file_path = Path(f.name)
+    frontmatter, remaining = parse_frontmatter_bytes(content.encode("utf-8"))
 
-    try:
-        frontmatter, remaining = parse_frontmatter(file_path)
-
-        assert frontmatter is not None
-        assert frontmatter.title == "Test Document"
-        assert frontmatter.author == "John Doe"
-        assert frontmatter.version is None
-        assert frontmatter.date is None
-    finally:
-        file_path.unlink()
+    assert frontmatter is not None
+    assert frontmatter.title == "Test Document"
+    assert frontmatter.author == "John Doe"
+    assert frontmatter.version is None
+    assert frontmatter.date is None
 
 
 def test_parse_frontmatter_empty_date():
@@ -102,20 +90,12 @@ date: ""
 ---
 """
 
-    with NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-        f.write(content)
-        f.flush()
-        file_path = Path(f.name)
-
-    try:
-        frontmatter, _ = parse_frontmatter(file_path)
-        assert frontmatter is not None
-        assert frontmatter.date is not None
-        # Date should be in YYYY-MM-DD format
-        assert len(frontmatter.date) == 10
-        assert frontmatter.date.count("-") == 2
-    finally:
-        file_path.unlink()
+    frontmatter, _ = parse_frontmatter_bytes(content.encode("utf-8"))
+    assert frontmatter is not None
+    assert frontmatter.date is not None
+    # Date should be in YYYY-MM-DD format
+    assert len(frontmatter.date) == 10
+    assert frontmatter.date.count("-") == 2
 
 
 def test_parse_frontmatter_malformed():
@@ -128,38 +108,22 @@ title: Test
 # Content
 """
 
-    with NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-        f.write(content)
-        f.flush()
-        file_path = Path(f.name)
-
-    try:
-        with pytest.raises(FrontmatterError):
-            parse_frontmatter(file_path)
-    finally:
-        file_path.unlink()
+    with pytest.raises(FrontmatterError):
+        parse_frontmatter_bytes(content.encode("utf-8"))
 
 
 def test_parse_frontmatter_no_closing_delimiter():
-    """Test file with opening --- but no closing delimiter."""
+    """Test content with opening --- but no closing delimiter."""
     content = """---
 title: Test
 
 # Content
 """
 
-    with NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-        f.write(content)
-        f.flush()
-        file_path = Path(f.name)
-
-    try:
-        frontmatter, remaining = parse_frontmatter(file_path)
-        # Should treat as no frontmatter
-        assert frontmatter is None
-        assert remaining == content
-    finally:
-        file_path.unlink()
+    frontmatter, remaining = parse_frontmatter_bytes(content.encode("utf-8"))
+    # Should treat as no frontmatter
+    assert frontmatter is None
+    assert remaining == content
 
 
 def test_parse_frontmatter_with_bom_and_crlf():
@@ -172,22 +136,37 @@ def test_parse_frontmatter_with_bom_and_crlf():
         "# Content\r\n" \
         "Body\r\n"
 
-    with NamedTemporaryFile(
-        mode="w", suffix=".md", delete=False, newline="", encoding="utf-8"
-    ) as f:
-        f.write(content)
-        f.flush()
-        file_path = Path(f.name)
+    frontmatter, remaining = parse_frontmatter_bytes(content.encode("utf-8"))
+    assert frontmatter is not None
+    assert frontmatter.title == "BOM Test"
+    assert frontmatter.author == "Jane Doe"
+    assert "# Content" in remaining
+    assert "Body" in remaining
 
-    try:
-        frontmatter, remaining = parse_frontmatter(file_path)
-        assert frontmatter is not None
-        assert frontmatter.title == "BOM Test"
-        assert frontmatter.author == "Jane Doe"
-        assert "# Content" in remaining
-        assert "Body" in remaining
-    finally:
-        file_path.unlink()
+
+def test_parse_frontmatter_indented_closing_delimiter():
+    """Test that a closing delimiter with leading whitespace is accepted."""
+    content = """---
+title: Indented Close
+  ---
+
+# Content
+"""
+
+    frontmatter, remaining = parse_frontmatter_bytes(content.encode("utf-8"))
+    assert frontmatter is not None
+    assert frontmatter.title == "Indented Close"
+    assert "# Content" in remaining
+
+
+def test_parse_frontmatter_latin1_fallback():
+    """Test that non-UTF-8 bytes fall back to latin-1 decoding."""
+    content = b"---\ntitle: M\xfcller Report\n---\n\n# Content\n"
+
+    frontmatter, remaining = parse_frontmatter_bytes(content)
+    assert frontmatter is not None
+    assert frontmatter.title == "Müller Report"
+    assert "# Content" in remaining
 
 
 def test_parse_frontmatter_empty_values():
@@ -201,20 +180,12 @@ version: "  "
 # Content
 """
 
-    with NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-        f.write(content)
-        f.flush()
-        file_path = Path(f.name)
-
-    try:
-        frontmatter, _ = parse_frontmatter(file_path)
-        assert frontmatter is not None
-        # Empty values should be ignored for non-date fields
-        assert frontmatter.title is None
-        assert frontmatter.author is None
-        assert frontmatter.version is None
-    finally:
-        file_path.unlink()
+    frontmatter, _ = parse_frontmatter_bytes(content.encode("utf-8"))
+    assert frontmatter is not None
+    # Empty values should be ignored for non-date fields
+    assert frontmatter.title is None
+    assert frontmatter.author is None
+    assert frontmatter.version is None
 
 
 def test_frontmatter_data_to_dict():
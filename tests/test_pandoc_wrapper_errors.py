@@ -52,7 +52,7 @@ def test_file_not_found_from_stat_race_condition(mock_shutil, mock_run):
                 output_file=broken_output,
                 output_format="docx",
             )
-        assert "deleted after creation" in str(exc_info.value).lower()
+        assert "was not created" in str(exc_info.value).lower()
         assert "Pandoc executable not found" not in str(exc_info.value)
 
     finally:
@@ -24,7 +24,8 @@ def test_get_profile_existing():
     assert profile is not None
     assert profile.name == "bericht"
     assert profile.display_name == "Bericht"
-    assert isinstance(profile.pandoc_args, list)
+    # pandoc_args is frozen to a tuple - profiles are shared objects
+    assert isinstance(profile.pandoc_args, tuple)
 
 
 def test_get_profile_nonexistent():
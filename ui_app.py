@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import atexit
+import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
@@ -20,13 +23,72 @@ from converter.errors import (
 from converter.profiles import list_profiles
 
 
-def _write_upload_to_temp(upload, suffix: str) -> Path:
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-    try:
-        temp_file.write(upload.getbuffer())
-    finally:
-        temp_file.close()
-    return Path(temp_file.name)
+# Static widget options as module-level tuples so every rerun hands
+# Streamlit the same object instead of a fresh list to re-diff. Profile
+# options stay behind the cached function below because custom profiles
+# register after import.
+_OUTPUT_OPTIONS = ("docx", "pdf", "beides")
+_PDF_ENGINE_OPTIONS = ("auto", "xelatex", "lualatex", "pdflatex")
+
+
+@st.cache_data(show_spinner=False)
+def _profile_options() -> list:
+    """Profile dropdown options, built once per session instead of per rerun."""
+    return ["(kein Profil)"] + list_profiles()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_converter(pandoc_path: Optional[str]) -> ConverterService:
+    """
+    Shared ConverterService per pandoc path.
+
+    Construction runs pandoc discovery (PATH scan); reusing the instance
+    also keeps the wrapper's version and PDF-engine caches warm across
+    conversions.
+    """
+    return ConverterService(pandoc_path=pandoc_path)
+
+
+# User-facing messages per converter error type, mirroring the dispatch
+# table cli.py uses; checked in order, first isinstance match wins
+_ERROR_MESSAGES = (
+    (PandocNotFoundError, "Pandoc nicht gefunden. Bitte installieren oder Pfad angeben."),
+    (PDFEngineNotFoundError, "LaTeX Engine fehlt. Bitte MiKTeX/TeX Live installieren."),
+    (FrontmatterError, "Frontmatter-Fehler in der Markdown-Datei."),
+    (ProfileError, "Profil-Fehler. Bitte Profil prüfen."),
+    (MermaidRenderError, "Mermaid-Diagramme konnten nicht gerendert werden."),
+    (ConversionError, "Konvertierung fehlgeschlagen."),
+)
+
+
+# Shared pool so "beides" overlaps the DOCX and PDF conversions; pandoc
+# runs as a subprocess, so two threads are enough and the GIL is released
+# while it works.
+_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+
+def _session_results_dir() -> Path:
+    """
+    Per-session directory holding converted outputs.
+
+    Keeping results on disk instead of as bytes in session state halves
+    peak memory per result and lets the download buttons stream straight
+    from the file.
+    """
+    results_dir = st.session_state.get("results_dir")
+    if results_dir is None:
+        results_dir = tempfile.mkdtemp(prefix="mdconv_ui_")
+        st.session_state["results_dir"] = results_dir
+        atexit.register(shutil.rmtree, results_dir, True)
+    return Path(results_dir)
+
+
+def _write_upload(upload, dest: Path) -> Path:
+    """Stream an uploaded file into the scratch directory in 1 MiB chunks."""
+    upload.seek(0)
+    with open(dest, "wb") as f:
+        shutil.copyfileobj(upload, f, length=1024 * 1024)
+    return dest
 
 
 def _convert_once(
@@ -36,19 +98,19 @@ def _convert_once(
     template_path: Optional[Path],
     profile_name: Optional[str],
     pdf_engine: Optional[str],
+    output_dir: Path,
     output_name: str,
-) -> Tuple[str, bytes]:
-    with tempfile.TemporaryDirectory() as temp_dir:
-        output_path = Path(temp_dir) / output_name
-        converter.convert(
-            input_path=str(input_path),
-            output_path=str(output_path),
-            template_path=str(template_path) if template_path else None,
-            profile_name=profile_name,
-            output_format=output_format,
-            pdf_engine=pdf_engine,
-        )
-        return output_path.name, output_path.read_bytes()
+) -> Tuple[str, Path]:
+    output_path = output_dir / output_name
+    converter.convert(
+        input_path=str(input_path),
+        output_path=str(output_path),
+        template_path=str(template_path) if template_path else None,
+        profile_name=profile_name,
+        output_format=output_format,
+        pdf_engine=pdf_engine,
+    )
+    return output_path.name, output_path
 
 
 def main() -> None:
@@ -76,17 +138,22 @@ def main() -> None:
 
     output_choice = st.radio(
         "Output",
-        options=["docx", "pdf", "beides"],
+        options=_OUTPUT_OPTIONS,
         horizontal=True,
+        key="output_choice",
     )
 
-    profile_options = ["(kein Profil)"] + list_profiles()
-    profile_choice = st.selectbox("Profil", options=profile_options)
+    profile_choice = st.selectbox(
+        "Profil",
+        options=_profile_options(),
+        key="profile_choice",
+    )
 
     pdf_engine_choice = st.selectbox(
         "PDF Engine",
-        options=["auto", "xelatex", "lualatex", "pdflatex"],
+        options=_PDF_ENGINE_OPTIONS,
         index=0,
+        key="pdf_engine_choice",
     )
 
     st.caption("Hinweis: DOCX-Template wird bei PDF ignoriert.")
@@ -102,91 +169,87 @@ def main() -> None:
 
     if convert_clicked:
         st.session_state["results"] = {}
-        input_path: Optional[Path] = None
-        template_path: Optional[Path] = None
+        results_dir = _session_results_dir()
+        for stale in results_dir.iterdir():
+            try:
+                stale.unlink()
+            except OSError:
+                pass
         try:
-            input_path = _write_upload_to_temp(md_upload, suffix=".md")
-            template_path = (
-                _write_upload_to_temp(template_upload, suffix=".docx")
-                if template_upload is not None
-                else None
-            )
+            # One scratch directory for uploads and outputs per click;
+            # cleaned up as a whole instead of per-file unlinks
+            with tempfile.TemporaryDirectory() as scratch:
+                scratch_dir = Path(scratch)
+                input_path = _write_upload(md_upload, scratch_dir / "input.md")
+                template_path = (
+                    _write_upload(template_upload, scratch_dir / "template.docx")
+                    if template_upload is not None
+                    else None
+                )
 
-            pandoc_path = pandoc_path_input.strip() or None
-            converter = ConverterService(pandoc_path=pandoc_path)
+                pandoc_path = pandoc_path_input.strip() or None
+                converter = _get_converter(pandoc_path)
 
-            profile_name = None if profile_choice == "(kein Profil)" else profile_choice
-            pdf_engine = None if pdf_engine_choice == "auto" else pdf_engine_choice
+                profile_name = None if profile_choice == "(kein Profil)" else profile_choice
+                pdf_engine = None if pdf_engine_choice == "auto" else pdf_engine_choice
 
-            input_stem = Path(md_upload.name).stem or "document"
+                input_stem = Path(md_upload.name).stem or "document"
 
-            formats = []
-            if output_choice == "beides":
-                formats = ["docx", "pdf"]
-            else:
-                formats = [output_choice]
-
-            results: Dict[str, Tuple[str, bytes]] = {}
-            for output_format in formats:
-                output_name = f"{input_stem}.{output_format}"
-                use_template = template_path if output_format == "docx" else None
-                name, data = _convert_once(
-                    converter=converter,
-                    input_path=input_path,
-                    output_format=output_format,
-                    template_path=use_template,
-                    profile_name=profile_name,
-                    pdf_engine=pdf_engine,
-                    output_name=output_name,
-                )
-                results[output_format] = (name, data)
+                formats = []
+                if output_choice == "beides":
+                    formats = ["docx", "pdf"]
+                else:
+                    formats = [output_choice]
+
+                futures = {
+                    output_format: _EXECUTOR.submit(
+                        _convert_once,
+                        converter=converter,
+                        input_path=input_path,
+                        output_format=output_format,
+                        template_path=(
+                            template_path if output_format == "docx" else None
+                        ),
+                        profile_name=profile_name,
+                        pdf_engine=pdf_engine,
+                        output_dir=results_dir,
+                        output_name=f"{input_stem}.{output_format}",
+                    )
+                    for output_format in formats
+                }
+
+                results: Dict[str, Tuple[str, Path]] = {
+                    output_format: futures[output_format].result()
+                    for output_format in formats
+                }
 
             st.session_state["results"] = results
             st.success("Konvertierung erfolgreich.")
 
-        except PandocNotFoundError as e:
-            st.error("Pandoc nicht gefunden. Bitte installieren oder Pfad angeben.")
-            with st.expander("Details"):
-                st.write(str(e))
-        except PDFEngineNotFoundError as e:
-            st.error("LaTeX Engine fehlt. Bitte MiKTeX/TeX Live installieren.")
-            with st.expander("Details"):
-                st.write(str(e))
-        except FrontmatterError as e:
-            st.error("Frontmatter-Fehler in der Markdown-Datei.")
-            with st.expander("Details"):
-                st.write(str(e))
-        except ProfileError as e:
-            st.error("Profil-Fehler. Bitte Profil prüfen.")
-            with st.expander("Details"):
-                st.write(str(e))
-        except ConversionError as e:
-            st.error("Konvertierung fehlgeschlagen.")
-            with st.expander("Details"):
-                st.write(str(e))
-        except MermaidRenderError as e:
-            st.error("Mermaid-Diagramme konnten nicht gerendert werden.")
-            with st.expander("Details"):
-                st.write(str(e))
         except Exception as e:
-            st.error("Unerwarteter Fehler.")
+            for exc_type, message in _ERROR_MESSAGES:
+                if isinstance(e, exc_type):
+                    st.error(message)
+                    break
+            else:
+                st.error("Unerwarteter Fehler.")
             with st.expander("Details"):
                 st.write(str(e))
-        finally:
-            if input_path and input_path.exists():
-                input_path.unlink()
-            if template_path and template_path.exists():
-                template_path.unlink()
 
     results = st.session_state.get("results", {})
     if results:
         st.subheader("Downloads")
-        for output_format, (filename, data) in results.items():
-            st.download_button(
-                label=f"{output_format.upper()} herunterladen",
-                data=data,
-                file_name=filename,
-            )
+        for output_format, (filename, output_path) in results.items():
+            output_path = Path(output_path)
+            if not output_path.exists():
+                continue
+            # Stream from disk instead of holding the bytes in session state
+            with open(output_path, "rb") as f:
+                st.download_button(
+                    label=f"{output_format.upper()} herunterladen",
+                    data=f,
+                    file_name=filename,
+                )
 
 
 if __name__ == "__main__":